@@ -0,0 +1,168 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+import orjson
+from cachetools import TLRUCache
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# How long a worker holds the fill lock for a key, and how long the other
+# workers wait for it to fill the key before loading it themselves
+LOCK_TTL_SECONDS = 5
+LOCK_POLL_INTERVAL = 0.05
+
+# In-process fallback, used when Redis isn't configured or can't be reached.
+# Entries are (value, ttl) so each key honours the ttl it was stored with
+local_cache = TLRUCache(maxsize=4096, ttu=lambda _key, entry, now: now + entry[1])
+_inflight: Dict[Hashable, asyncio.Future] = {}
+
+_redis = None
+
+
+class _RedisUnavailable(Exception):
+    """Redis failed before loader() ran, so it's safe to fall back"""
+
+
+class _LoadCancelled(Exception):
+    """The caller running loader() was cancelled, so waiters load it themselves"""
+
+
+def _get_redis():
+    """Lazily connect to Redis. Returns None when it isn't configured."""
+    global _redis
+    if _redis is None and settings.redis_url:
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            logger.warning("REDIS_URL is set but the redis package isn't installed")
+            return None
+        _redis = redis.from_url(settings.redis_url)
+    return _redis
+
+
+async def get_or_set(
+    key: str,
+    ttl: int,
+    loader: Callable[[], Awaitable[Any]]
+) -> Tuple[Any, bool]:
+    """
+    Return the cached value for key, calling loader() to fill it on a miss.
+    Concurrent misses for the same key share a single loader() call.
+    Returns (value, hit) so callers can report cache status.
+    """
+    client = _get_redis()
+    if client is not None:
+        try:
+            return await _redis_get_or_set(client, key, ttl, loader)
+        except _RedisUnavailable:
+            logger.warning("Redis unavailable, using in-process cache", exc_info=True)
+
+    return await _local_get_or_set(key, ttl, loader)
+
+
+async def get_shared(key: str) -> Optional[Any]:
+    """Read a value published to Redis. None if missing or Redis isn't available."""
+    client = _get_redis()
+    if client is None:
+        return None
+    try:
+        cached = await client.get(key)
+    except Exception:
+        logger.warning("Failed to read %s from Redis", key, exc_info=True)
+        return None
+    return orjson.loads(cached) if cached is not None else None
+
+
+async def set_shared(key: str, value: Any, ttl: int):
+    """Publish a value to Redis for other workers. No-op without Redis."""
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        await client.set(key, orjson.dumps(value), ex=ttl)
+    except Exception:
+        logger.warning("Failed to store %s in Redis", key, exc_info=True)
+
+
+async def _redis_get_or_set(client, key, ttl, loader):
+    lock_key = f"lock:{key}"
+
+    try:
+        cached = await client.get(key)
+        if cached is not None:
+            return orjson.loads(cached), True
+        locked = await client.set(lock_key, "1", nx=True, ex=LOCK_TTL_SECONDS)
+    except Exception as e:
+        raise _RedisUnavailable() from e
+
+    if not locked:
+        # Another worker is loading this key, wait for it to land
+        for _ in range(int(LOCK_TTL_SECONDS / LOCK_POLL_INTERVAL)):
+            await asyncio.sleep(LOCK_POLL_INTERVAL)
+            try:
+                cached = await client.get(key)
+            except Exception as e:
+                raise _RedisUnavailable() from e
+            if cached is not None:
+                return orjson.loads(cached), True
+        # Lock holder died or is too slow, load it ourselves
+
+    value = await loader()
+
+    try:
+        await client.set(key, orjson.dumps(value), ex=ttl)
+        if locked:
+            await client.delete(lock_key)
+    except Exception:
+        logger.warning("Failed to store %s in Redis", key, exc_info=True)
+
+    return value, False
+
+
+async def single_flight(key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+    """
+    Call loader(), sharing the call with any concurrent callers for key.
+    Returns (value, shared), where shared means another caller's load was reused.
+    If the caller running loader() is cancelled, the others load it
+    themselves rather than being cancelled with it.
+    """
+    while True:
+        pending = _inflight.get(key)
+        if pending is None:
+            break
+        try:
+            return await asyncio.shield(pending), True
+        except _LoadCancelled:
+            # Only the loading caller was cancelled, not us: take over the load
+            continue
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        value = await loader()
+    except asyncio.CancelledError:
+        future.set_exception(_LoadCancelled())
+        future.exception()  # Mark retrieved when nobody else was waiting
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # Mark retrieved when nobody else was waiting
+        raise
+    finally:
+        _inflight.pop(key, None)
+
+    future.set_result(value)
+    return value, False
+
+
+async def _local_get_or_set(key, ttl, loader):
+    if key in local_cache:
+        return local_cache[key][0], True
+
+    value, shared = await single_flight(key, loader)
+    if not shared:
+        local_cache[key] = (value, ttl)
+    return value, shared
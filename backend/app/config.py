@@ -1,4 +1,7 @@
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from typing import Annotated, Dict, List, Optional
+
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -10,9 +13,70 @@ class Settings(BaseSettings):
     youtube_api_key: str
     tmdb_api_key: str
     database_url: str = "sqlite+aiosqlite:///./quickflicks.db"
+    pool_size: int = 20
+    max_overflow: int = 10
+    pool_timeout: int = 30
+    pool_recycle: int = 1800
+    auto_create_tables: bool = False  # Create tables on startup (dev only)
     api_timeout: int = 10
+    api_connect_timeout: int = 5
     cache_ttl: int = 180
+    # Per-category overrides for cache_ttl, e.g. "movies=3600,tv=3600"
+    category_cache_ttls: Annotated[Dict[str, int], NoDecode] = {}
+    # Response caching, both per route and for the service's scored results.
+    # Upstream TMDB/YouTube metadata caches stay on either way
+    cache_enabled: bool = True
+    redis_url: Optional[str] = None  # Shared cache across workers; in-process if unset
     max_results_per_query: int = 50
+    log_level: str = "INFO"
+
+    # Comma-separated list of frontend origins allowed by CORS
+    allowed_origins: Annotated[List[str], NoDecode] = [
+        "https://streamfinder-app.vercel.app",
+        "http://localhost:5173",  # Local development
+        "http://localhost:3000",  # Alternative local port
+    ]
+
+    # Interaction logging is buffered and written in batches
+    interaction_batch_size: int = 200
+    interaction_batch_ms: int = 50
+    interaction_queue_size: int = 10000
+
+    # /stats serves a summary recomputed in the background
+    stats_refresh_seconds: int = 30
+
+    @field_validator("allowed_origins", mode="before")
+    @classmethod
+    def parse_allowed_origins(cls, v):
+        if not isinstance(v, str):
+            return v
+        origins = [origin.strip() for origin in v.split(",") if origin.strip()]
+        for origin in origins:
+            if origin != "*" and not origin.startswith(("http://", "https://")):
+                raise ValueError(f"Invalid ALLOWED_ORIGINS entry {origin!r}, expected a scheme://host origin")
+        return origins
+
+    @field_validator("category_cache_ttls", mode="before")
+    @classmethod
+    def parse_category_cache_ttls(cls, v):
+        # Parsed once at startup, so a malformed value fails here
+        # rather than on the first request that caches a response
+        if not isinstance(v, str):
+            return v
+        ttls = {}
+        for entry in v.split(","):
+            if not entry.strip():
+                continue
+            name, _, ttl = entry.partition("=")
+            try:
+                ttls[name.strip()] = int(ttl)
+            except ValueError:
+                raise ValueError(f"Invalid CATEGORY_CACHE_TTLS entry {entry.strip()!r}, expected category=seconds")
+        return ttls
+
+    def cache_ttl_for(self, category: str) -> int:
+        """Response cache TTL for a category, falling back to cache_ttl"""
+        return self.category_cache_ttls.get(category, self.cache_ttl)
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,15 +1,50 @@
+import orjson
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 
 from app.config import settings
 
 # Create async engine
-# Note: SQLite doesn't support pool_size/max_overflow parameters
+# Note: SQLite doesn't support pool_size/max_overflow parameters, so pool
+# tuning only applies to server databases like Postgres
+if settings.database_url.startswith("sqlite"):
+    engine_options = {
+        "connect_args": {"check_same_thread": False},
+    }
+else:
+    engine_options = {
+        "pool_size": settings.pool_size,
+        "max_overflow": settings.max_overflow,
+        "pool_timeout": settings.pool_timeout,
+        "pool_recycle": settings.pool_recycle,
+        "pool_pre_ping": True,
+    }
+
 engine = create_async_engine(
     settings.database_url,
     echo=False,
+    # JSON columns (e.g. UserInteraction.recommendations) go through orjson
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
+    **engine_options,
 )
 
+if "sqlite" in settings.database_url:
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        WAL lets readers run alongside the frequent interaction writes,
+        and synchronous=NORMAL only fsyncs at checkpoints in WAL mode.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        cursor.execute("PRAGMA cache_size=-64000")  # 64 MB
+        cursor.close()
+
 # Session factory for handling database connections
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -23,8 +58,12 @@ Base = declarative_base()
 async def init_db():
     """
     Initialize the database by creating all tables.
-    Called on application startup.
+    Called on application startup. Only runs when AUTO_CREATE_TABLES is set,
+    so production workers don't each re-inspect the schema on boot.
     """
+    if not settings.auto_create_tables:
+        return
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
@@ -0,0 +1,75 @@
+import asyncio
+import logging
+from typing import Dict, List
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import UserInteraction
+
+logger = logging.getLogger(__name__)
+
+
+class InteractionBuffer:
+    """
+    Buffers logged interactions in memory and writes them in batches.
+    One transaction per batch instead of one per request keeps the
+    logging endpoint cheap under sustained traffic.
+    """
+
+    def __init__(self, batch_size: int, batch_ms: int, max_queued: int):
+        self.batch_size = batch_size
+        self.batch_interval = batch_ms / 1000
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queued)
+
+    def put(self, row: Dict) -> bool:
+        """
+        Queue a row for the next flush.
+        Returns False if the buffer is full and the row was dropped.
+        """
+        try:
+            self.queue.put_nowait(row)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    async def run(self):
+        """
+        Flush loop, started as a background task from the app lifespan.
+        Waits up to batch_ms for a batch to fill, then writes it.
+        """
+        while True:
+            if self.queue.qsize() < self.batch_size:
+                await asyncio.sleep(self.batch_interval)
+            if not self.queue.empty():
+                await self.flush()
+
+    async def flush(self):
+        """Write up to batch_size queued rows in a single transaction"""
+        batch: List[Dict] = []
+        while len(batch) < self.batch_size and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+
+        try:
+            async with AsyncSessionLocal() as session:
+                async with session.begin():
+                    await session.execute(UserInteraction.__table__.insert(), batch)
+        except asyncio.CancelledError:
+            # Shutting down mid-write: put the rows back so drain() picks them up
+            for row in batch:
+                self.queue.put_nowait(row)
+            raise
+        except Exception:
+            # Interaction logging is non-critical, drop the batch
+            logger.exception("Failed to write %d interactions", len(batch))
+
+    async def drain(self):
+        """Write out everything still queued. Called on shutdown."""
+        while not self.queue.empty():
+            await self.flush()
+
+
+interaction_buffer = InteractionBuffer(
+    batch_size=settings.interaction_batch_size,
+    batch_ms=settings.interaction_batch_ms,
+    max_queued=settings.interaction_queue_size,
+)
@@ -1,25 +1,73 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+import asyncio
+import atexit
+import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+from app.config import settings
 from app.database import init_db
+from app.interactions import interaction_buffer
+from app.middleware import log_requests
 from app.routes import router
+from app.services import RecommendationService
+from app.stats import refresh_stats_periodically
 from app import __version__
 
 
+def configure_logging() -> QueueListener:
+    """
+    Send log records through a queue so the stream writes happen on the
+    listener thread instead of blocking the event loop.
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(settings.log_level.upper())
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+configure_logging()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Startup and shutdown logic.
-    Creates database tables on startup.
+    Creates database tables and starts background tasks on startup.
     """
     # Startup: initialize database
     await init_db()
-    yield
-    # Shutdown: cleanup if needed (database connections close automatically)
+    # The service owns one pooled HTTP/2 client for all YouTube/TMDB calls
+    app.state.rec_service = RecommendationService()
+    flusher = asyncio.create_task(interaction_buffer.run())
+    stats_refresher = asyncio.create_task(refresh_stats_periodically())
+    try:
+        yield
+    finally:
+        # Shutdown: stop background tasks and write out any buffered interactions
+        for task in (stats_refresher, flusher):
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        await interaction_buffer.drain()
+        await app.state.rec_service.aclose()
 
 
 app = FastAPI(
@@ -27,21 +75,26 @@ app = FastAPI(
     description="Fast video recommendation platform",
     version=__version__,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware to allow frontend requests
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "https://streamfinder-app.vercel.app",
-        "http://localhost:5173",  # Local development
-        "http://localhost:3000",  # Alternative local port
-    ],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=settings.allowed_origins,
+    allow_credentials=False,
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
+# Compress larger responses (recommendation lists are often 20+ KB of JSON).
+# Level 5 trades a little ratio for lower CPU per response.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Log each request and its duration (health checks are skipped)
+app.middleware("http")(log_requests)
+
 # Include all routes
 app.include_router(router, prefix="/api", tags=["recommendations"])
 
@@ -4,15 +4,23 @@ from fastapi import Request
 
 logger = logging.getLogger(__name__)
 
+HEALTH_PATH = "/api/health"
+
 async def log_requests(request: Request, call_next):
-    """Middleware to log all incoming requests"""
-    start_time = time.time()
-    
-    logger.info(f"Request: {request.method} {request.url.path}")
-    
+    """Middleware to log all incoming requests (except health checks)"""
+    if request.url.path == HEALTH_PATH:
+        return await call_next(request)
+
+    if not logger.isEnabledFor(logging.INFO):
+        return await call_next(request)
+
+    start_time = time.perf_counter_ns()
+
+    logger.info("Request: %s %s", request.method, request.url.path)
+
     response = await call_next(request)
-    
-    process_time = time.time() - start_time
-    logger.info(f"Completed in {process_time:.2f}s")
-    
+
+    process_time_ms = (time.perf_counter_ns() - start_time) / 1e6
+    logger.info("Completed in %.2fms", process_time_ms)
+
     return response
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, JSON, Float
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Float, Index, func
 
 from app.database import Base
 
@@ -12,12 +12,20 @@ class UserInteraction(Base):
     """
 
     __tablename__ = "user_interactions"
+    __table_args__ = (
+        # Covers the /stats GROUP BY category + clicked_video_id count,
+        # and equality lookups on category as the leading column
+        Index("ix_interactions_cat_click", "category", "clicked_video_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    timestamp = Column(DateTime, default=datetime.utcnow, index=True)
+    # default fills rows in tables created before server_default existed,
+    # since create_all never alters an existing table (and SQLite can't add
+    # a column default in place)
+    timestamp = Column(DateTime, default=datetime.utcnow, server_default=func.now(), index=True)
 
     # What they were looking for
-    category = Column(String, index=True)  # movies, tv, youtube, tiktok
+    category = Column(String)  # movies, tv, youtube, tiktok
     search_query = Column(String)  # what the user searched for
     region = Column(String, index=True)
 
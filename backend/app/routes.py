@@ -1,19 +1,37 @@
-from typing import Dict, List, Optional
-from fastapi import APIRouter, Depends, HTTPException
+import hashlib
+import logging
+from typing import Dict, List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field, validator
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app import cache, stats
+from app.config import settings
 from app.database import get_db
+from app.interactions import interaction_buffer
 from app.models import UserInteraction
 from app.services import RecommendationService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
-recommendation_service = RecommendationService()
+cache_counters = {"hits": 0, "misses": 0}
+
+# Categories whose queries are free-text searches, where word order,
+# plurals and common abbreviations don't change the results worth showing,
+# so near-duplicate queries share a cache entry. Movie/TV queries are TMDB
+# title lookups and only get whitespace/case normalized
+NEAR_DUPLICATE_QUERY_CATEGORIES = frozenset({"youtube", "tiktok"})
+QUERY_WORD_ALIASES = {"vid": "video", "vids": "video", "news": "news"}
+# Words ending in these aren't plurals ("glass", "bus", "analysis")
+NON_PLURAL_ENDINGS = ("ss", "us", "is")
 
 
 class RecommendationRequest(BaseModel):
     """Input schema for recommendation requests"""
-    category: str  # movies, tv, youtube, tiktok
+    category: Literal["movies", "tv", "youtube", "tiktok"]
     searchQuery: str = Field(..., min_length=1, max_length=200)  # what the user is searching for
     region: str = "US"
     limit: int = Field(default=20, ge=1, le=50)
@@ -40,6 +58,39 @@ class InteractionLog(BaseModel):
     session_id: str
 
 
+def get_recommendation_service(request: Request) -> RecommendationService:
+    """
+    Dependency returning the service created in the app lifespan,
+    which owns the shared HTTP client.
+    """
+    service = getattr(request.app.state, "rec_service", None)
+    if service is None:
+        # App running without its lifespan (e.g. a bare TestClient)
+        service = request.app.state.rec_service = RecommendationService()
+    return service
+
+
+def _normalize_query_word(word: str) -> str:
+    alias = QUERY_WORD_ALIASES.get(word)
+    if alias is not None:
+        return alias
+    if len(word) > 3 and word.endswith("s") and not word.endswith(NON_PLURAL_ENDINGS):
+        return word[:-1]
+    return word
+
+
+def _recommendation_cache_key(request: RecommendationRequest) -> str:
+    """Cache key for a request, normalized so trivial query variations share an entry"""
+    words = request.searchQuery.lower().split()
+    if request.category in NEAR_DUPLICATE_QUERY_CATEGORIES:
+        # "funny cat videos" and "cat funny vids" share an entry, while
+        # numbers and every other word still have to match exactly
+        words = sorted(_normalize_query_word(word) for word in words)
+    query = " ".join(words)
+    query_hash = hashlib.sha1(query.encode()).hexdigest()
+    return f"rec:{request.category}:{request.region.upper()}:{request.limit}:{query_hash}"
+
+
 @router.get("/health")
 async def health_check():
     """
@@ -49,9 +100,10 @@ async def health_check():
     return {"status": "healthy", "service": "QuickFlicks API"}
 
 
-@router.post("/recommendations")
+@router.post("/recommendations", response_model=None)
 async def get_recommendations(
     request: RecommendationRequest,
+    recommendation_service: RecommendationService = Depends(get_recommendation_service),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -59,42 +111,51 @@ async def get_recommendations(
     Takes user preferences and returns personalized video suggestions.
     """
     try:
-        # Validate category
-        valid_categories = ["movies", "tv", "youtube", "tiktok"]
-        if request.category not in valid_categories:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid category. Must be one of: {valid_categories}"
+        async def fetch_results():
+            # Get recommendations from the service
+            results = await recommendation_service.get_recommendations(
+                category=request.category,
+                search_query=request.searchQuery,
+                region=request.region,
+                limit=request.limit
             )
 
-        # Get recommendations from the service
-        results = await recommendation_service.get_recommendations(
-            category=request.category,
-            search_query=request.searchQuery,
-            region=request.region,
-            limit=request.limit
-        )
+            # Ensure results is a list
+            if results is None:
+                results = []
 
-        # Ensure results is a list
-        if results is None:
-            results = []
+            if not isinstance(results, list):
+                logger.warning("results is not a list, got %s", type(results))
+                results = []
 
-        if not isinstance(results, list):
-            print(f"Warning: results is not a list, got {type(results)}")
-            results = []
+            return results
 
-        return {
-            "success": True,
-            "count": len(results),
-            "results": results,
-            "search_query": request.searchQuery,
-        }
+        if settings.cache_enabled:
+            results, hit = await cache.get_or_set(
+                _recommendation_cache_key(request),
+                settings.cache_ttl_for(request.category),
+                fetch_results,
+            )
+        else:
+            results, hit = await fetch_results(), False
+
+        cache_counters["hits" if hit else "misses"] += 1
+
+        # Results are plain dicts from the service, so skip FastAPI's
+        # jsonable_encoder pass and serialize them straight to JSON
+        return ORJSONResponse(
+            {
+                "success": True,
+                "count": len(results),
+                "results": results,
+                "search_query": request.searchQuery,
+            },
+            headers={"X-Cache": "HIT" if hit else "MISS"},
+        )
 
     except Exception as e:
         # Log the error for debugging
-        import traceback
-        print(f"Error in recommendations endpoint: {type(e).__name__}: {str(e)}")
-        traceback.print_exc()
+        logger.exception("recommendations failed", extra={"category": request.category})
 
         # Return a more helpful error message
         raise HTTPException(
@@ -103,7 +164,7 @@ async def get_recommendations(
         )
 
 
-@router.post("/interactions")
+@router.post("/interactions", response_model=None)
 async def log_interaction(
     interaction: InteractionLog,
     db: AsyncSession = Depends(get_db)
@@ -111,20 +172,25 @@ async def log_interaction(
     """
     Log user interactions for future improvements.
     Called when users filter, view results, or click on videos.
+    Rows are buffered and written in batches, so this usually returns immediately.
     """
-    try:
-        # Create database record
-        db_interaction = UserInteraction(
-            category=interaction.category,
-            search_query=interaction.searchQuery,
-            region=interaction.region,
-            recommendations=interaction.recommendations,
-            clicked_video_id=interaction.clicked_video_id,
-            clicked_position=interaction.clicked_position,
-            session_id=interaction.session_id,
-        )
+    row = {
+        "category": interaction.category,
+        "search_query": interaction.searchQuery,
+        "region": interaction.region,
+        "recommendations": interaction.recommendations,
+        "clicked_video_id": interaction.clicked_video_id,
+        "clicked_position": interaction.clicked_position,
+        "session_id": interaction.session_id,
+    }
+
+    if interaction_buffer.put(row):
+        return {"success": True, "message": "Interaction logged"}
 
-        db.add(db_interaction)
+    try:
+        # Buffer is full: write this row directly, which also slows
+        # the client down until the flusher catches up
+        await db.execute(insert(UserInteraction).values(**row))
         await db.commit()
 
         return {"success": True, "message": "Interaction logged"}
@@ -140,45 +206,17 @@ async def get_stats(db: AsyncSession = Depends(get_db)):
     """
     Get platform statistics (for internal monitoring).
     Shows what categories are most popular, click-through rates, etc.
+    Served from a summary refreshed in the background.
     """
     try:
-        from sqlalchemy import select, func
-
-        # Count total interactions
-        result = await db.execute(
-            select(func.count(UserInteraction.id))
-        )
-        total_interactions = result.scalar()
-
-        # Count by category
-        result = await db.execute(
-            select(
-                UserInteraction.category,
-                func.count(UserInteraction.id)
-            ).group_by(UserInteraction.category)
-        )
-        category_counts = dict(result.fetchall())
-
-        # Count clicks
-        result = await db.execute(
-            select(func.count(UserInteraction.id)).where(
-                UserInteraction.clicked_video_id.isnot(None)
-            )
-        )
-        total_clicks = result.scalar()
-
-        return {
-            "total_interactions": total_interactions,
-            "total_clicks": total_clicks,
-            "click_through_rate": (
-                round(total_clicks / total_interactions * 100, 2)
-                if total_interactions > 0 else 0
-            ),
-            "category_breakdown": category_counts,
-        }
-
-    except Exception as e:
+        summary = await stats.get_stats_summary(db)
+    except Exception:
         raise HTTPException(
             status_code=500,
             detail="Failed to fetch stats"
         )
+
+    return {
+        **summary,
+        "recommendation_cache": dict(cache_counters),
+    }
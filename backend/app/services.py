@@ -1,29 +1,299 @@
 import asyncio
 import random
 import re
+import sys
+import time
 import logging
-from typing import List, Dict, Optional
-from datetime import datetime, timedelta
-from cachetools import TTLCache
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
+from zoneinfo import ZoneInfo
+from cachetools import LRUCache, TLRUCache, TTLCache
 import httpx
+import orjson
 from urllib.parse import quote
 
+from app.cache import single_flight
 from app.config import settings
+from app.throttle import AdaptiveLimiter, CircuitOpen
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# In-memory cache with 3-minute TTL to reduce API calls
-recommendation_cache = TTLCache(maxsize=1000, ttl=settings.cache_ttl)
+# In-memory cache of scored results, keyed by (category, query, region).
+# Entries expire after the category's cache TTL (3 minutes by default)
+recommendation_cache = TLRUCache(
+    maxsize=1000,
+    ttu=lambda key, _value, now: now + settings.cache_ttl_for(key[0]),
+)
+
+# TMDB metadata changes on the order of days, so it's cached far longer
+# than responses. Keyed by (id or query, media_type); only successful
+# lookups are stored. Provider availability changes more often.
+TMDB_DETAILS_TTL = 6 * 3600
+TMDB_PROVIDERS_TTL = 3600
+tmdb_details_cache = TTLCache(maxsize=10_000, ttl=TMDB_DETAILS_TTL)
+tmdb_similar_cache = TTLCache(maxsize=2_000, ttl=TMDB_DETAILS_TTL)
+tmdb_search_cache = TTLCache(maxsize=2_000, ttl=TMDB_DETAILS_TTL)
+tmdb_providers_cache = TTLCache(maxsize=10_000, ttl=TMDB_PROVIDERS_TTL)
+
+# YouTube searches cost 100 quota units each, so repeat lookups for the
+# same fallback query are served from memory
+youtube_search_cache = TTLCache(maxsize=2048, ttl=3600)
+
+# Parsed published_at timestamps. Mock results and repeat searches reuse
+# the same strings, so most ranking passes skip fromisoformat entirely
+_parsed_timestamps = LRUCache(maxsize=4096)
+
+YOUTUBE_QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+
+# Max concurrent TMDB requests per fan-out, to stay clear of 429s
+TMDB_CONCURRENCY = 10
+# Max concurrent watch provider lookups across all requests
+TMDB_PROVIDER_CONCURRENCY = 8
+
+# Categories served from TMDB rather than YouTube
+TMDB_CATEGORIES = frozenset({"movies", "tv"})
+
+# TMDB genre IDs, used for /discover genre filters
+GENRE_NAME_TO_ID = {
+    "Action": 28, "Adventure": 12, "Animation": 16, "Comedy": 35,
+    "Crime": 80, "Documentary": 99, "Drama": 18, "Family": 10751,
+    "Fantasy": 14, "History": 36, "Horror": 27, "Music": 10402,
+    "Mystery": 9648, "Romance": 10749, "Science Fiction": 878,
+    "TV Movie": 10770, "Thriller": 53, "War": 10752, "Western": 37,
+}
+
+# Source fields that only candidate details can match; if the source has
+# none of them, scoring falls back to the listing payloads
+SCORING_SIGNAL_FIELDS = ("director", "cast", "keywords", "companies", "collection")
+
+# Set-overlap scoring factors: (details field, points per shared item, max points)
+OVERLAP_FACTORS = (
+    ("cast", 5, 25),
+    ("genres", 10, 20),
+    ("keywords", 2, 15),
+    ("companies", 7.5, 15),
+)
+
+# TMDB watch provider IDs for the platforms we link to
+PROVIDER_ID_TO_NAME = {
+    8: "netflix",
+    9: "prime",
+    337: "disney",
+    15: "hulu",
+    384: "hbo",
+    350: "apple",
+    386: "peacock",
+}
+
+# Platforms whose search needs a login link to their home page,
+# so the URL doesn't depend on the title
+PLATFORM_HOME_URLS = {
+    "netflix": "https://www.netflix.com/browse",
+    "disney": "https://www.disneyplus.com/",
+    "hulu": "https://www.hulu.com/hub/home",
+    "hbo": "https://www.max.com/",  # HBO Max (now Max)
+    "apple": "https://tv.apple.com/",
+    "peacock": "https://www.peacocktv.com/",
+}
+PRIME_SEARCH_URL = "https://www.amazon.com/s?k={}&i=instant-video"
+
+# Primary platform preference for a card: Netflix > Disney+ > Prime > Hulu > HBO > Others
+PLATFORM_RANK = {
+    p: i for i, p in enumerate(("netflix", "disney", "prime", "hulu", "hbo", "apple", "peacock"))
+}
+
+def _with_watch_urls(videos: tuple) -> tuple:
+    """Append each video's YouTube watch URL, so it's formatted once at import"""
+    return tuple((*video, f"https://www.youtube.com/watch?v={video[1]}") for video in videos)
+
+
+# Fallback results served when the YouTube/TMDB APIs fail or return nothing.
+# Real, working YouTube videos, kept as tuples since they never change:
+# (title, video_id, thumbnail[, channel], watch_url)
+MOCK_YOUTUBE_VIDEOS = _with_watch_urls((
+    ("MrBeast - $1 vs $500,000 Experiences", "jk7GA4EZZrw", "https://i.ytimg.com/vi/jk7GA4EZZrw/hqdefault.jpg", "MrBeast"),
+    ("Mark Rober - Glitter Bomb 5.0", "h4T_LlK1VE4", "https://i.ytimg.com/vi/h4T_LlK1VE4/hqdefault.jpg", "Mark Rober"),
+    ("Veritasium - The Most Powerful Computers", "IxkSlnrRFqc", "https://i.ytimg.com/vi/IxkSlnrRFqc/hqdefault.jpg", "Veritasium"),
+    ("Marques Brownlee - iPhone 15 Review", "TUXpoM9OY3M", "https://i.ytimg.com/vi/TUXpoM9OY3M/hqdefault.jpg", "MKBHD"),
+    ("Kurzgesagt - What if You Detonated a Nuclear Bomb", "5iPH-br_eJQ", "https://i.ytimg.com/vi/5iPH-br_eJQ/hqdefault.jpg", "Kurzgesagt"),
+    ("Vsauce - What If Everyone Jumped at Once", "jHbyQ_AQP8c", "https://i.ytimg.com/vi/jHbyQ_AQP8c/hqdefault.jpg", "Vsauce"),
+    ("Dude Perfect - Extreme Hide and Seek", "rf0Lsjewg8c", "https://i.ytimg.com/vi/rf0Lsjewg8c/hqdefault.jpg", "Dude Perfect"),
+    ("Casey Neistat - DO WHAT YOU CAN'T", "jG7dSXcfVqE", "https://i.ytimg.com/vi/jG7dSXcfVqE/hqdefault.jpg", "Casey Neistat"),
+))
+
+MOCK_SHORTS = _with_watch_urls((
+    ("Labubu Unboxing #1", "nXA_f0xBSjw", "https://i.ytimg.com/vi/nXA_f0xBSjw/hqdefault.jpg", "Toy Reviews"),
+    ("Labubu Collection Tour", "8VGF-rQqF7Q", "https://i.ytimg.com/vi/8VGF-rQqF7Q/hqdefault.jpg", "Collectibles Hub"),
+    ("Viral Dance Trend", "2g6J6vT5mBU", "https://i.ytimg.com/vi/2g6J6vT5mBU/hqdefault.jpg", "TikTok Dancer"),
+    ("Funny Cat Moment", "J---aiyznGQ", "https://i.ytimg.com/vi/J---aiyznGQ/hqdefault.jpg", "Cat Lover"),
+    ("Quick Recipe Hack", "0FTw0UHb3vw", "https://i.ytimg.com/vi/0FTw0UHb3vw/hqdefault.jpg", "Food Shorts"),
+    ("Life Hack You Need", "dQw4w9WgXcQ", "https://i.ytimg.com/vi/dQw4w9WgXcQ/hqdefault.jpg", "Daily Tips"),
+    ("Satisfying Video", "9bZkp7q19f0", "https://i.ytimg.com/vi/9bZkp7q19f0/hqdefault.jpg", "Oddly Satisfying"),
+    ("Epic Fail Compilation", "K5le9sYdYkM", "https://i.ytimg.com/vi/K5le9sYdYkM/hqdefault.jpg", "Fail Army"),
+    ("Magic Trick Revealed", "YbJOTdZBX1g", "https://i.ytimg.com/vi/YbJOTdZBX1g/hqdefault.jpg", "Magic Show"),
+    ("Cute Puppy Reaction", "2Vv-BfVoq4g", "https://i.ytimg.com/vi/2Vv-BfVoq4g/hqdefault.jpg", "Pet Channel"),
+))
+
+# Every mock result carries one of these, so ranking a mock-heavy
+# response only works out their recency once
+MOCK_PUBLISHED_AT = "2024-01-15T12:00:00Z"
+MOCK_TRAILER_PUBLISHED_AT = "2024-01-10T12:00:00Z"
+
+# Field order of a mock result. Each fallback fills in its shared fields
+# once and copies that per video, which is cheaper than building every
+# dict from a literal
+MOCK_RESULT_TEMPLATE = dict.fromkeys(
+    ("id", "title", "description", "thumbnail", "channel", "published_at", "platform", "url")
+)
+
+# Popular movie/TV trailers by title, plus defaults for unmatched queries
+MOCK_MOVIE_TRAILERS = {
+    "avengers": _with_watch_urls((
+        ("Iron Man Official Trailer", "8ugaeA-nMTc", "https://i.ytimg.com/vi/8ugaeA-nMTc/hqdefault.jpg"),
+        ("Captain America: Winter Soldier Trailer", "7SlILk2WMTI", "https://i.ytimg.com/vi/7SlILk2WMTI/hqdefault.jpg"),
+        ("Thor Official Trailer", "JOddp-nlNvQ", "https://i.ytimg.com/vi/JOddp-nlNvQ/hqdefault.jpg"),
+        ("Guardians of the Galaxy Trailer", "d96cjJhvlMA", "https://i.ytimg.com/vi/d96cjJhvlMA/hqdefault.jpg"),
+        ("Black Panther Official Trailer", "xjDjIWPwcPU", "https://i.ytimg.com/vi/xjDjIWPwcPU/hqdefault.jpg"),
+        ("Doctor Strange Trailer", "HSzx-zryEgM", "https://i.ytimg.com/vi/HSzx-zryEgM/hqdefault.jpg"),
+    )),
+    "inception": _with_watch_urls((
+        ("Interstellar Trailer", "zSWdZVtXT7E", "https://i.ytimg.com/vi/zSWdZVtXT7E/hqdefault.jpg"),
+        ("Shutter Island Trailer", "5iaYLCiq5RM", "https://i.ytimg.com/vi/5iaYLCiq5RM/hqdefault.jpg"),
+        ("The Prestige Trailer", "o4gHCmTQDVI", "https://i.ytimg.com/vi/o4gHCmTQDVI/hqdefault.jpg"),
+        ("Memento Trailer", "HDWylEQSwFo", "https://i.ytimg.com/vi/HDWylEQSwFo/hqdefault.jpg"),
+        ("Tenet Trailer", "AZGcmvrTX9M", "https://i.ytimg.com/vi/AZGcmvrTX9M/hqdefault.jpg"),
+        ("The Matrix Trailer", "m8e-FF8MsqU", "https://i.ytimg.com/vi/m8e-FF8MsqU/hqdefault.jpg"),
+    )),
+    "spider-man": _with_watch_urls((
+        ("Spider-Man: No Way Home", "JfVOs4VSpmA", "https://i.ytimg.com/vi/JfVOs4VSpmA/hqdefault.jpg"),
+        ("Spider-Man: Into the Spider-Verse", "g4Hbz2jLxvQ", "https://i.ytimg.com/vi/g4Hbz2jLxvQ/hqdefault.jpg"),
+        ("The Amazing Spider-Man", "DyLUwOcR5pk", "https://i.ytimg.com/vi/DyLUwOcR5pk/hqdefault.jpg"),
+        ("Spider-Man: Homecoming", "rk-dF1lIbIg", "https://i.ytimg.com/vi/rk-dF1lIbIg/hqdefault.jpg"),
+        ("Spider-Man: Far From Home", "Nt9L1jCKGnE", "https://i.ytimg.com/vi/Nt9L1jCKGnE/hqdefault.jpg"),
+        ("Venom", "u9Mv98Gr5pY", "https://i.ytimg.com/vi/u9Mv98Gr5pY/hqdefault.jpg"),
+    )),
+    "batman": _with_watch_urls((
+        ("The Batman Trailer", "mqqft2x_Aa4", "https://i.ytimg.com/vi/mqqft2x_Aa4/hqdefault.jpg"),
+        ("The Dark Knight Trailer", "EXeTwQWrcwY", "https://i.ytimg.com/vi/EXeTwQWrcwY/hqdefault.jpg"),
+        ("Batman Begins Trailer", "neY2xVmOfUM", "https://i.ytimg.com/vi/neY2xVmOfUM/hqdefault.jpg"),
+        ("Joker Trailer", "zAGVQLHvwOY", "https://i.ytimg.com/vi/zAGVQLHvwOY/hqdefault.jpg"),
+        ("Justice League Trailer", "3cxixDgHUYw", "https://i.ytimg.com/vi/3cxixDgHUYw/hqdefault.jpg"),
+        ("Superman Man of Steel", "T6DJcgm3wNY", "https://i.ytimg.com/vi/T6DJcgm3wNY/hqdefault.jpg"),
+    )),
+}
+
+MOCK_DEFAULT_TRAILERS = _with_watch_urls((
+    ("Dune: Part Two Trailer", "Way9Dexny3w", "https://i.ytimg.com/vi/Way9Dexny3w/hqdefault.jpg"),
+    ("Oppenheimer Trailer", "uYPbbksJxIg", "https://i.ytimg.com/vi/uYPbbksJxIg/hqdefault.jpg"),
+    ("Barbie Trailer", "pBk4NYhWNMM", "https://i.ytimg.com/vi/pBk4NYhWNMM/hqdefault.jpg"),
+    ("Deadpool & Wolverine", "73_1biulkYk", "https://i.ytimg.com/vi/73_1biulkYk/hqdefault.jpg"),
+    ("The Marvels Trailer", "wS_qbDztgVY", "https://i.ytimg.com/vi/wS_qbDztgVY/hqdefault.jpg"),
+    ("Top Gun: Maverick", "giXco2jaZ_4", "https://i.ytimg.com/vi/giXco2jaZ_4/hqdefault.jpg"),
+))
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value else value
+
+
+def _seconds_until_quota_reset() -> float:
+    """YouTube Data API quotas reset at midnight Pacific time"""
+    now = datetime.now(YOUTUBE_QUOTA_TIMEZONE)
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), YOUTUBE_QUOTA_TIMEZONE)
+    return (midnight - now).total_seconds()
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO timestamp as an aware datetime, treating naive values as UTC"""
+    published = _parsed_timestamps.get(value)
+    if published is None:
+        published = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if published.tzinfo is None:
+            published = published.replace(tzinfo=timezone.utc)
+        _parsed_timestamps[value] = published
+    return published
+
+
+async def _single_flight(
+    cache: TTLCache,
+    key: Hashable,
+    fetch: Callable[[], Awaitable[Any]]
+) -> Any:
+    """
+    Return cache[key], calling fetch() to fill it on a miss.
+    Concurrent misses for the same key share one fetch() call.
+    None results are returned but not cached.
+    """
+    if key in cache:
+        return cache[key]
+
+    value, shared = await single_flight((id(cache), key), fetch)
+    if value is not None and not shared:
+        cache[key] = value
+    return value
+
+
+async def _gather_limited(coros, limit: int = TMDB_CONCURRENCY) -> list:
+    """
+    asyncio.gather with at most `limit` coroutines in flight.
+    Exceptions are returned in place of results.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=True)
 
 
 class RecommendationService:
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         self.youtube_base_url = "https://www.googleapis.com/youtube/v3"
         self.tmdb_base_url = "https://api.themoviedb.org/3"
         self.api_key = settings.youtube_api_key
         self.tmdb_api_key = settings.tmdb_api_key
-        self.timeout = settings.api_timeout
+        self.timeout = httpx.Timeout(settings.api_timeout, connect=settings.api_connect_timeout)
+        # Shared across requests so connections to YouTube/TMDB are reused
+        # (and multiplexed over HTTP/2) instead of re-handshaking per call
+        self.client = client or httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            http2=True,
+        )
+        # Shared by every request on this service, so concurrent searches
+        # together stay under TMDB's rate limit for the provider fan-out
+        self._provider_semaphore = asyncio.Semaphore(TMDB_PROVIDER_CONCURRENCY)
+        # Backs off YouTube concurrency on 429/5xx and skips calls entirely
+        # while it's rate limiting us, so quota errors fail fast to mock data
+        self.youtube_limiter = AdaptiveLimiter("YouTube")
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def _youtube_search(self, params: dict) -> httpx.Response:
+        """
+        GET YouTube /search through the adaptive limiter.
+        Raises CircuitOpen while YouTube is rate limiting us, or without
+        an API key, since the request could only fail.
+        """
+        if not self.api_key:
+            raise CircuitOpen("YouTube API key not configured")
+
+        async with self.youtube_limiter.slot():
+            start = time.perf_counter()
+            response = await self.client.get(f"{self.youtube_base_url}/search", params=params)
+        self.youtube_limiter.record(
+            response.status_code,
+            time.perf_counter() - start,
+            response.headers.get("retry-after"),
+        )
+        if response.status_code == 403 and b"quotaExceeded" in response.content:
+            # The daily quota won't come back before it resets
+            self.youtube_limiter.open_for(_seconds_until_quota_reset())
+        return response
 
     def _get_tmdb_keys(self, media_type: str):
         return ("title", "release_date") if media_type == "movie" else ("name", "first_air_date")
@@ -33,16 +303,23 @@ class RecommendationService:
                 else "https://via.placeholder.com/500x750/831010/ffffff?text=No+Poster")
 
     def _transform_youtube_item(self, item: dict) -> Optional[dict]:
-        video_id = item["id"].get("videoId")
+        """
+        Convert a YouTube search item into a result card.
+        Returns None for non-video items; missing snippet fields come back
+        empty instead of failing the whole search.
+        """
+        video_id = (item.get("id") or {}).get("videoId")
         if not video_id:
             return None
+        snippet = item.get("snippet") or {}
+        high = (snippet.get("thumbnails") or {}).get("high") or {}
         return {
             "id": video_id,
-            "title": item["snippet"]["title"],
-            "description": item["snippet"]["description"],
-            "thumbnail": item["snippet"]["thumbnails"]["high"]["url"],
-            "channel": item["snippet"]["channelTitle"],
-            "published_at": item["snippet"]["publishedAt"],
+            "title": snippet.get("title", ""),
+            "description": snippet.get("description", ""),
+            "thumbnail": high.get("url", ""),
+            "channel": snippet.get("channelTitle", ""),
+            "published_at": snippet.get("publishedAt", ""),
             "platform": "youtube",
             "url": f"https://www.youtube.com/watch?v={video_id}",
         }
@@ -54,21 +331,23 @@ class RecommendationService:
         region: str = "US",
         limit: int = 20
     ) -> List[Dict]:
-        cache_key = f"{category}:{search_query}:{region}"
-        if cache_key in recommendation_cache:
+        # Full scored list is cached and sliced per request, so limit isn't part of the key
+        cache_key = (category, " ".join(search_query.lower().split()), region.upper())
+        if settings.cache_enabled and cache_key in recommendation_cache:
             return recommendation_cache[cache_key][:limit]
 
         if category == "youtube":
             results = await self._get_youtube_recommendations(search_query, region)
         elif category == "tiktok":
             results = await self._get_tiktok_style_recommendations(search_query, region)
-        elif category in ["movies", "tv"]:
+        elif category in TMDB_CATEGORIES:
             results = await self._get_movie_recommendations(search_query, region, category)
         else:
             results = []
 
         scored_results = self._score_and_rank(results)
-        recommendation_cache[cache_key] = scored_results
+        if settings.cache_enabled:
+            recommendation_cache[cache_key] = scored_results
         return scored_results[:limit]
 
     async def _get_youtube_recommendations(self, search_query: str, region: str) -> List[Dict]:
@@ -85,35 +364,38 @@ class RecommendationService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.youtube_base_url}/search", params=params)
-                response.raise_for_status()
-                data = response.json()
-
-                # Check for API errors
-                if "error" in data:
-                    error_msg = data["error"].get("message", "Unknown YouTube API error")
-                    print(f"YouTube API Error: {error_msg}")
-                    return self._get_mock_youtube_results(search_query)
+            response = await self._youtube_search(params)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+
+            # Check for API errors
+            if "error" in data:
+                logger.warning(
+                    "YouTube API error for %r: %s",
+                    search_query, data["error"].get("message", "Unknown YouTube API error"),
+                )
+                return self._get_mock_youtube_results(search_query)
 
-                results = []
-                for item in data.get("items", []):
-                    transformed = self._transform_youtube_item(item)
-                    if transformed:
-                        results.append(transformed)
-                return results if results else self._get_mock_youtube_results(search_query)
-        except Exception as e:
-            print(f"YouTube API Exception: {type(e).__name__}: {str(e)}")
+            results = []
+            for item in data.get("items", []):
+                transformed = self._transform_youtube_item(item)
+                if transformed:
+                    results.append(transformed)
+            return results if results else self._get_mock_youtube_results(search_query)
+        except CircuitOpen:
+            # Already logged when the breaker opened
+            return self._get_mock_youtube_results(search_query)
+        except Exception:
+            logger.warning("YouTube search failed for %r", search_query, exc_info=True)
             return self._get_mock_youtube_results(search_query)
 
     async def _get_tiktok_style_recommendations(self, search_query: str, region: str) -> List[Dict]:
-        results = []
         search_strategies = [
             f"{search_query} tiktok viral",
             f"{search_query} #shorts",
         ]
 
-        for query_variant in search_strategies:
+        async def _one(query_variant: str) -> List[Dict]:
             try:
                 params = {
                     "part": "snippet",
@@ -126,22 +408,34 @@ class RecommendationService:
                     "key": self.api_key,
                 }
 
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(f"{self.youtube_base_url}/search", params=params)
-                    response.raise_for_status()
-                    data = response.json()
-
-                    for item in data.get("items", []):
-                        transformed = self._transform_youtube_item(item)
-                        if transformed:
-                            transformed["platform"] = "tiktok"
-                            results.append(transformed)
-            except Exception as e:
-                print(f"TikTok search error for '{query_variant}': {type(e).__name__}: {str(e)}")
-                continue
+                response = await self._youtube_search(params)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+
+                variant_results = []
+                for item in data.get("items", []):
+                    transformed = self._transform_youtube_item(item)
+                    if transformed:
+                        transformed["platform"] = "tiktok"
+                        variant_results.append(transformed)
+                return variant_results
+            except CircuitOpen:
+                return []
+            except Exception:
+                logger.warning("TikTok search failed for %r", query_variant, exc_info=True)
+                return []
+
+        # Both searches run concurrently; results keep strategy order for the dedupe below
+        batches = await asyncio.gather(*(_one(q) for q in search_strategies))
+        results = [r for batch in batches for r in batch]
 
         seen_ids = set()
-        unique_results = [r for r in results if r["id"] not in seen_ids and not seen_ids.add(r["id"])]
+        unique_results = []
+        for r in results:
+            result_id = r["id"]
+            if result_id not in seen_ids:
+                seen_ids.add(result_id)
+                unique_results.append(r)
         return unique_results[:15] if unique_results else self._get_mock_shorts_results(search_query)
 
     async def _get_movie_recommendations(self, search_query: str, region: str, category: str) -> List[Dict]:
@@ -194,27 +488,21 @@ class RecommendationService:
             # Step 5: For top matches, get platform availability
             # ONLY show movies that are available on real streaming platforms
             # Skip movies with no platform availability
-            for item in scored_items[:30]:  # Check more items to ensure we get 15 with platforms
-                platforms = await self._get_tmdb_watch_providers(item["id"], media_type)
+            top_items = scored_items[:30]  # Check more items to ensure we get 15 with platforms
+
+            providers_list = await _gather_limited(
+                [self._get_tmdb_watch_providers(item["id"], media_type) for item in top_items]
+            )
+
+            for item, platforms in zip(top_items, providers_list):
+                if isinstance(platforms, BaseException):
+                    continue
 
                 # ONLY include if there's at least one streaming platform
                 if platforms:
-                    # Prioritize platforms: Netflix > Disney+ > Prime > Hulu > HBO > Others
-                    platform_priority = ["netflix", "disney", "prime", "hulu", "hbo", "apple", "peacock"]
-                    primary_platform = platforms[0]
-
-                    for priority_platform in platform_priority:
-                        for p in platforms:
-                            if p["platform"] == priority_platform:
-                                primary_platform = p
-                                break
-                        if primary_platform["platform"] in platform_priority:
-                            break
-
-                    # Get additional details for the card
-                    details = await self._get_tmdb_details(item["id"], media_type)
-                    rating = details.get("rating", 0) if details else 0
-                    release_year = details.get("release_year", "") if details else ""
+                    primary_platform = min(
+                        platforms, key=lambda p: PLATFORM_RANK.get(p["platform"], len(PLATFORM_RANK))
+                    )
 
                     # Create single card with primary platform
                     similar_shows.append({
@@ -227,8 +515,8 @@ class RecommendationService:
                         "platform": primary_platform["platform"],
                         "url": primary_platform["url"],
                         "all_platforms": [p["platform"] for p in platforms],  # Store all platforms
-                        "rating": round(rating, 1),
-                        "year": release_year,
+                        "rating": round(item["rating"], 1),
+                        "year": item["release_year"],
                     })
 
                 # Stop when we have 15 movies with valid platforms
@@ -237,9 +525,9 @@ class RecommendationService:
 
             return similar_shows
 
-        except Exception as e:
+        except Exception:
             # Log the error for debugging
-            logger.error(f"TMDB Error: {type(e).__name__}: {str(e)}", exc_info=True)
+            logger.exception("TMDB lookup failed for %r", search_query)
             # Fallback to YouTube search on any error
             return await self._search_youtube_content(
                 f"{category} similar to {search_query}",
@@ -253,6 +541,16 @@ class RecommendationService:
         Search TMDB for a movie or TV show.
         Returns the first match with ID and basic info.
         """
+        match = await _single_flight(
+            tmdb_search_cache,
+            (query.strip().lower(), media_type),
+            lambda: self._fetch_tmdb_search(query, media_type),
+        )
+        # {} is a cached "no results", None a failed search
+        return match or None
+
+    async def _fetch_tmdb_search(self, query: str, media_type: str) -> Optional[Dict]:
+        """Returns None if the search failed, so the miss isn't cached"""
         try:
             params = {
                 "api_key": self.tmdb_api_key,
@@ -261,31 +559,31 @@ class RecommendationService:
                 "page": 1,
             }
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.tmdb_base_url}/search/{media_type}",
-                    params=params
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await self.client.get(
+                f"{self.tmdb_base_url}/search/{media_type}",
+                params=params
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
 
-                if data.get("results"):
-                    result = data["results"][0]
-                    title_key = "title" if media_type == "movie" else "name"
-                    date_key = "release_date" if media_type == "movie" else "first_air_date"
+            match = {}
+            if data.get("results"):
+                result = data["results"][0]
+                title_key = "title" if media_type == "movie" else "name"
+                date_key = "release_date" if media_type == "movie" else "first_air_date"
 
-                    return {
-                        "id": result["id"],
-                        "title": result[title_key],
-                        "overview": result.get("overview", ""),
-                        "poster_url": f"https://image.tmdb.org/t/p/w500{result['poster_path']}" if result.get("poster_path") else "https://via.placeholder.com/500x750/831010/ffffff?text=No+Poster",
-                        "release_date": result.get(date_key, ""),
-                    }
+                match = {
+                    "id": result["id"],
+                    "title": result[title_key],
+                    "overview": result.get("overview", ""),
+                    "poster_url": f"https://image.tmdb.org/t/p/w500{result['poster_path']}" if result.get("poster_path") else "https://via.placeholder.com/500x750/831010/ffffff?text=No+Poster",
+                    "release_date": result.get(date_key, ""),
+                }
 
-                return None
+            return match
 
-        except Exception as e:
-            print(f"TMDB search error for '{query}': {type(e).__name__}: {str(e)}")
+        except Exception:
+            logger.warning("TMDB search failed for %r", query, exc_info=True)
             return None
 
     async def _get_tmdb_similar(self, media_id: int, media_type: str) -> List[Dict]:
@@ -293,6 +591,16 @@ class RecommendationService:
         Get similar movies/shows from TMDB.
         Filters for popular/trending content only (popularity > 10).
         """
+        similar_items = await _single_flight(
+            tmdb_similar_cache,
+            (media_id, media_type),
+            lambda: self._fetch_tmdb_similar(media_id, media_type),
+        )
+        # Callers annotate candidates (e.g. with _score), so hand out copies
+        return [dict(item) for item in similar_items] if similar_items else []
+
+    async def _fetch_tmdb_similar(self, media_id: int, media_type: str) -> Optional[List[Dict]]:
+        """Returns None if the lookup failed, so the miss isn't cached"""
         try:
             params = {
                 "api_key": self.tmdb_api_key,
@@ -300,166 +608,114 @@ class RecommendationService:
                 "page": 1,
             }
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.tmdb_base_url}/{media_type}/{media_id}/similar",
-                    params=params
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                similar_items = []
-                title_key = "title" if media_type == "movie" else "name"
-                date_key = "release_date" if media_type == "movie" else "first_air_date"
-
-                for item in data.get("results", [])[:30]:  # Get more to filter from
-                    # Only include popular movies/shows (popularity > 10)
-                    if item.get("popularity", 0) > 10:
-                        similar_items.append({
-                            "id": item["id"],
-                            "title": item[title_key],
-                            "overview": item.get("overview", ""),
-                            "poster_url": f"https://image.tmdb.org/t/p/w500{item['poster_path']}" if item.get("poster_path") else "https://via.placeholder.com/500x750/831010/ffffff?text=No+Poster",
-                            "release_date": item.get(date_key, ""),
-                            "popularity": item.get("popularity", 0),
-                        })
+            response = await self.client.get(
+                f"{self.tmdb_base_url}/{media_type}/{media_id}/similar",
+                params=params
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+
+            similar_items = []
+            title_key = "title" if media_type == "movie" else "name"
+            date_key = "release_date" if media_type == "movie" else "first_air_date"
+
+            for item in data.get("results", [])[:30]:  # Get more to filter from
+                # Only include popular movies/shows (popularity > 10)
+                if item.get("popularity", 0) > 10:
+                    similar_items.append({
+                        "id": item["id"],
+                        "title": item[title_key],
+                        "overview": item.get("overview", ""),
+                        "poster_url": f"https://image.tmdb.org/t/p/w500{item['poster_path']}" if item.get("poster_path") else "https://via.placeholder.com/500x750/831010/ffffff?text=No+Poster",
+                        "release_date": item.get(date_key, ""),
+                        "popularity": item.get("popularity", 0),
+                        "genre_ids": item.get("genre_ids", []),
+                        "vote_average": item.get("vote_average", 0) or 0,
+                    })
 
-                # Sort by popularity
-                similar_items.sort(key=lambda x: x.get("popularity", 0), reverse=True)
+            # Sort by popularity
+            similar_items.sort(key=itemgetter("popularity"), reverse=True)
 
-                return similar_items[:20]  # Return top 20 popular items
+            return similar_items[:20]  # Return top 20 popular items
 
-        except Exception as e:
-            print(f"TMDB similar error for {media_type} {media_id}: {type(e).__name__}: {str(e)}")
-            return []
+        except Exception:
+            logger.warning("TMDB similar failed for %s %s", media_type, media_id, exc_info=True)
+            return None
 
     async def _get_tmdb_watch_providers(self, media_id: int, media_type: str) -> List[Dict]:
         """
         Get streaming platform availability for a movie/show in the US.
         Returns list of {platform, url} dictionaries with direct platform links.
         """
+        providers = await _single_flight(
+            tmdb_providers_cache,
+            (media_id, media_type),
+            lambda: self._fetch_tmdb_watch_providers(media_id, media_type),
+        )
+        return providers if providers is not None else []
+
+    async def _fetch_tmdb_watch_providers(self, media_id: int, media_type: str) -> Optional[List[Dict]]:
+        """Returns None if the lookup failed, so the miss isn't cached"""
         try:
+            # Providers are appended to the details call so the title
+            # for the platform URLs comes back in the same response
             params = {
                 "api_key": self.tmdb_api_key,
+                "append_to_response": "watch/providers",
             }
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.tmdb_base_url}/{media_type}/{media_id}/watch/providers",
+            async with self._provider_semaphore:
+                response = await self.client.get(
+                    f"{self.tmdb_base_url}/{media_type}/{media_id}",
                     params=params
                 )
-                response.raise_for_status()
-                data = response.json()
-
-                providers = []
-                us_data = data.get("results", {}).get("US", {})
-
-                # Get title and TMDB ID for constructing URLs
-                title = await self._get_tmdb_title(media_id, media_type)
-
-                # Map TMDB provider IDs to platform info
-                # Using direct links where possible, JustWatch as fallback
-                provider_mapping = {
-                    8: "netflix",
-                    9: "prime",
-                    337: "disney",
-                    15: "hulu",
-                    384: "hbo",
-                    350: "apple",
-                    386: "peacock",
-                }
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+
+            providers = []
+            us_data = data.get("watch/providers", {}).get("results", {}).get("US", {})
+
+            title_key = "title" if media_type == "movie" else "name"
+            title = data.get(title_key, "Unknown")
+
+            # Check flatrate (subscription streaming)
+            for provider in us_data.get("flatrate", []):
+                provider_id = provider["provider_id"]
+                platform = PROVIDER_ID_TO_NAME.get(provider_id)
+                if platform:
+                    url = self._construct_platform_url(platform, media_id, media_type, title)
+                    providers.append({
+                        "platform": platform,
+                        "url": url,
+                    })
 
-                # Check flatrate (subscription streaming)
-                for provider in us_data.get("flatrate", []):
+            # Check buy/rent options if no flatrate
+            if not providers:
+                for provider in us_data.get("buy", [])[:3]:  # Limit to 3
                     provider_id = provider["provider_id"]
-                    if provider_id in provider_mapping:
-                        platform = provider_mapping[provider_id]
+                    platform = PROVIDER_ID_TO_NAME.get(provider_id)
+                    if platform:
                         url = self._construct_platform_url(platform, media_id, media_type, title)
                         providers.append({
                             "platform": platform,
                             "url": url,
                         })
 
-                # Check buy/rent options if no flatrate
-                if not providers:
-                    for provider in us_data.get("buy", [])[:3]:  # Limit to 3
-                        provider_id = provider["provider_id"]
-                        if provider_id in provider_mapping:
-                            platform = provider_mapping[provider_id]
-                            url = self._construct_platform_url(platform, media_id, media_type, title)
-                            providers.append({
-                                "platform": platform,
-                                "url": url,
-                            })
-
-                return providers
+            return providers
 
         except Exception:
-            return []
+            return None
 
     def _construct_platform_url(self, platform: str, tmdb_id: int, media_type: str, title: str) -> str:
         """
         Construct direct links to streaming platforms.
         All links go to the actual streaming platform, never to Google.
         """
-        # Clean title for URL
-        clean_title = quote(title)
-
-        # Platform-specific URL construction - all go to real streaming sites
-        if platform == "netflix":
-            # Netflix browse page - they require login for search
-            return f"https://www.netflix.com/browse"
-
-        elif platform == "prime":
-            # Amazon Prime Video search
-            return f"https://www.amazon.com/s?k={clean_title}&i=instant-video"
-
-        elif platform == "disney":
-            # Disney+ home (search requires login)
-            return f"https://www.disneyplus.com/"
-
-        elif platform == "hulu":
-            # Hulu search
-            return f"https://www.hulu.com/hub/home"
-
-        elif platform == "hbo":
-            # HBO Max (now Max) home
-            return f"https://www.max.com/"
-
-        elif platform == "apple":
-            # Apple TV+ home
-            return f"https://tv.apple.com/"
-
-        elif platform == "peacock":
-            # Peacock home
-            return f"https://www.peacocktv.com/"
-
-        else:
-            # Fallback to Prime Video search
-            return f"https://www.amazon.com/s?k={clean_title}&i=instant-video"
-
-    async def _get_tmdb_title(self, media_id: int, media_type: str) -> str:
-        """
-        Get the title of a movie/show from TMDB.
-        """
-        try:
-            params = {
-                "api_key": self.tmdb_api_key,
-            }
-
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.tmdb_base_url}/{media_type}/{media_id}",
-                    params=params
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                title_key = "title" if media_type == "movie" else "name"
-                return data.get(title_key, "Unknown")
-
-        except Exception:
-            return "Unknown"
+        url = PLATFORM_HOME_URLS.get(platform)
+        if url is not None:
+            return url
+        # Prime Video search, also the fallback for unknown platforms
+        return PRIME_SEARCH_URL.format(quote(title))
 
     async def _get_tmdb_details(self, media_id: int, media_type: str) -> Optional[Dict]:
         """
@@ -467,100 +723,102 @@ class RecommendationService:
         - Cast, crew, director
         - Genres, keywords
         - Production companies
-        - Budget, revenue, runtime
+        - Budget, runtime
         - Collection/franchise
+
+        Only the fields used for scoring are kept, as tuples of interned
+        strings, since thousands of these stay in tmdb_details_cache.
         """
+        return await _single_flight(
+            tmdb_details_cache,
+            (media_id, media_type),
+            lambda: self._fetch_tmdb_details(media_id, media_type),
+        )
+
+    async def _fetch_tmdb_details(self, media_id: int, media_type: str) -> Optional[Dict]:
+        """Returns None if the lookup failed, so the miss isn't cached"""
         try:
             params = {
                 "api_key": self.tmdb_api_key,
                 "append_to_response": "credits,keywords",
             }
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.tmdb_base_url}/{media_type}/{media_id}",
-                    params=params
+            response = await self.client.get(
+                f"{self.tmdb_base_url}/{media_type}/{media_id}",
+                params=params
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+
+            # Extract director (for movies)
+            director = None
+            if media_type == "movie" and "credits" in data:
+                for crew_member in data["credits"].get("crew", []):
+                    if crew_member.get("job") == "Director":
+                        director = _intern(crew_member.get("name"))
+                        break
+
+            # Extract top cast
+            cast = ()
+            if "credits" in data:
+                cast = tuple(
+                    sys.intern(person["name"])
+                    for person in data["credits"].get("cast", [])[:10]
                 )
-                response.raise_for_status()
-                data = response.json()
-
-                # Extract director (for movies)
-                director = None
-                if media_type == "movie" and "credits" in data:
-                    for crew_member in data["credits"].get("crew", []):
-                        if crew_member.get("job") == "Director":
-                            director = crew_member.get("name")
-                            break
-
-                # Extract top cast
-                cast = []
-                if "credits" in data:
-                    cast = [
-                        person["name"]
-                        for person in data["credits"].get("cast", [])[:10]
-                    ]
-
-                # Extract genres
-                genres = [g["name"] for g in data.get("genres", [])]
-
-                # Extract keywords
-                keywords = []
-                if "keywords" in data:
-                    if media_type == "movie":
-                        keywords = [
-                            k["name"]
-                            for k in data["keywords"].get("keywords", [])[:15]
-                        ]
-                    else:
-                        keywords = [
-                            k["name"]
-                            for k in data["keywords"].get("results", [])[:15]
-                        ]
-
-                # Extract production companies
-                companies = [c["name"] for c in data.get("production_companies", [])[:5]]
-
-                # Extract collection name safely
-                collection = None
-                belongs_to_col = data.get("belongs_to_collection")
-                if media_type == "movie" and belongs_to_col and isinstance(belongs_to_col, dict):
-                    collection = belongs_to_col.get("name")
-
-                # Get runtime safely
-                runtime = 0
-                if media_type == "movie":
-                    runtime = data.get("runtime", 0) or 0
-                else:
-                    episode_run_times = data.get("episode_run_time")
-                    if episode_run_times and isinstance(episode_run_times, list) and len(episode_run_times) > 0:
-                        runtime = episode_run_times[0]
-
-                # Get release year safely
-                release_year = ""
-                release_date = data.get("release_date", "")
-                first_air_date = data.get("first_air_date", "")
-                if release_date and len(release_date) >= 4:
-                    release_year = release_date[:4]
-                elif first_air_date and len(first_air_date) >= 4:
-                    release_year = first_air_date[:4]
-
-                return {
-                    "id": media_id,
-                    "director": director,
-                    "cast": cast,
-                    "genres": genres,
-                    "keywords": keywords,
-                    "companies": companies,
-                    "budget": data.get("budget", 0) or 0 if media_type == "movie" else 0,
-                    "revenue": data.get("revenue", 0) or 0 if media_type == "movie" else 0,
-                    "runtime": runtime,
-                    "rating": data.get("vote_average", 0) or 0,
-                    "release_year": release_year,
-                    "collection": collection,
-                }
 
-        except Exception as e:
-            logger.error(f"Error getting TMDB details: {e}", exc_info=True)
+            # Extract genres
+            genres = tuple(sys.intern(g["name"]) for g in data.get("genres", []))
+
+            # Extract keywords
+            keywords = ()
+            if "keywords" in data:
+                keyword_list = data["keywords"].get("keywords" if media_type == "movie" else "results", [])
+                keywords = tuple(sys.intern(k["name"]) for k in keyword_list[:15])
+
+            # Extract production companies
+            companies = tuple(sys.intern(c["name"]) for c in data.get("production_companies", [])[:5])
+
+            # Extract collection name safely
+            collection = None
+            belongs_to_col = data.get("belongs_to_collection")
+            if media_type == "movie" and belongs_to_col and isinstance(belongs_to_col, dict):
+                collection = _intern(belongs_to_col.get("name"))
+
+            # Get runtime safely
+            runtime = 0
+            if media_type == "movie":
+                runtime = data.get("runtime", 0) or 0
+            else:
+                episode_run_times = data.get("episode_run_time")
+                if episode_run_times and isinstance(episode_run_times, list) and len(episode_run_times) > 0:
+                    runtime = episode_run_times[0]
+
+            # Get release year safely
+            release_year = ""
+            release_date = data.get("release_date", "")
+            first_air_date = data.get("first_air_date", "")
+            if release_date and len(release_date) >= 4:
+                release_year = sys.intern(release_date[:4])
+            elif first_air_date and len(first_air_date) >= 4:
+                release_year = sys.intern(first_air_date[:4])
+
+            details = {
+                "id": media_id,
+                "director": director,
+                "cast": cast,
+                "genres": genres,
+                "keywords": keywords,
+                "companies": companies,
+                "budget": data.get("budget", 0) or 0 if media_type == "movie" else 0,
+                "runtime": runtime,
+                "rating": data.get("vote_average", 0) or 0,
+                "release_year": release_year,
+                "collection": collection,
+            }
+            return details
+
+        except Exception:
+            logger.warning("TMDB details failed for %s %s", media_type, media_id, exc_info=True)
             return None
 
     async def _get_tmdb_recommendations_multi_strategy(
@@ -578,61 +836,77 @@ class RecommendationService:
         """
         all_candidates = {}  # Use dict to avoid duplicates
 
+        # Strategy 1 (TMDB similar) and Strategy 2 (discover by genre) are
+        # independent requests, so fetch them concurrently
+        strategy_results = await asyncio.gather(
+            self._get_tmdb_similar(media_id, media_type),
+            self._discover_by_genre(media_id, media_type, source_details),
+            return_exceptions=True,
+        )
+
+        for items in strategy_results:
+            if isinstance(items, BaseException):
+                logger.error("Candidate strategy failed for %s %s", media_type, media_id, exc_info=items)
+                continue
+            for item in items:
+                if item["id"] not in all_candidates:
+                    all_candidates[item["id"]] = item
+
+        return list(all_candidates.values())[:30]  # Return top 30 candidates
+
+    async def _discover_by_genre(
+        self,
+        media_id: int,
+        media_type: str,
+        source_details: Dict
+    ) -> List[Dict]:
+        """
+        Discover popular movies/shows sharing the source's genres.
+        """
+        if not source_details.get("genres"):
+            return []
+
         try:
-            # Strategy 1: TMDB similar movies
-            similar_items = await self._get_tmdb_similar(media_id, media_type)
-            for item in similar_items:
-                all_candidates[item["id"]] = item
-
-            # Strategy 2: Discover by genre (only popular/trending)
-            if source_details.get("genres"):
-                genre_params = {
-                    "api_key": self.tmdb_api_key,
-                    "with_genres": ",".join([str(g) for g in await self._get_genre_ids(source_details["genres"], media_type)]),
-                    "sort_by": "popularity.desc",
-                    "vote_count.gte": "100",  # At least 100 votes (ensures popularity)
-                    "page": 1,
-                }
+            genre_params = {
+                "api_key": self.tmdb_api_key,
+                "with_genres": ",".join(
+                    str(GENRE_NAME_TO_ID[name]) for name in source_details["genres"] if name in GENRE_NAME_TO_ID
+                ),
+                "sort_by": "popularity.desc",
+                "vote_count.gte": "100",  # At least 100 votes (ensures popularity)
+                "page": 1,
+            }
 
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(
-                        f"{self.tmdb_base_url}/discover/{media_type}",
-                        params=genre_params
-                    )
-                    if response.status_code == 200:
-                        data = response.json()
-                        for item in data.get("results", [])[:15]:
-                            if item["id"] not in all_candidates and item["id"] != media_id:
-                                # Only include popular items
-                                if item.get("popularity", 0) > 10:
-                                    title_key = "title" if media_type == "movie" else "name"
-                                    date_key = "release_date" if media_type == "movie" else "first_air_date"
-                                    all_candidates[item["id"]] = {
-                                        "id": item["id"],
-                                        "title": item[title_key],
-                                        "overview": item.get("overview", ""),
-                                        "poster_url": f"https://image.tmdb.org/t/p/w500{item['poster_path']}" if item.get("poster_path") else "https://via.placeholder.com/500x750/831010/ffffff?text=No+Poster",
-                                        "release_date": item.get(date_key, ""),
-                                        "popularity": item.get("popularity", 0),
-                                    }
-
-            return list(all_candidates.values())[:30]  # Return top 30 candidates
-
-        except Exception as e:
-            logger.error(f"Error in multi-strategy recommendations: {e}", exc_info=True)
-            return list(all_candidates.values())
-
-    async def _get_genre_ids(self, genre_names: List[str], media_type: str) -> List[int]:
-        """Convert genre names to TMDB genre IDs"""
-        genre_mapping = {
-            "Action": 28, "Adventure": 12, "Animation": 16, "Comedy": 35,
-            "Crime": 80, "Documentary": 99, "Drama": 18, "Family": 10751,
-            "Fantasy": 14, "History": 36, "Horror": 27, "Music": 10402,
-            "Mystery": 9648, "Romance": 10749, "Science Fiction": 878,
-            "TV Movie": 10770, "Thriller": 53, "War": 10752, "Western": 37,
-        }
+            response = await self.client.get(
+                f"{self.tmdb_base_url}/discover/{media_type}",
+                params=genre_params
+            )
+            if response.status_code != 200:
+                return []
+
+            data = orjson.loads(response.content)
+            title_key = "title" if media_type == "movie" else "name"
+            date_key = "release_date" if media_type == "movie" else "first_air_date"
+
+            discovered = []
+            for item in data.get("results", [])[:15]:
+                # Only include popular items
+                if item["id"] != media_id and item.get("popularity", 0) > 10:
+                    discovered.append({
+                        "id": item["id"],
+                        "title": item[title_key],
+                        "overview": item.get("overview", ""),
+                        "poster_url": f"https://image.tmdb.org/t/p/w500{item['poster_path']}" if item.get("poster_path") else "https://via.placeholder.com/500x750/831010/ffffff?text=No+Poster",
+                        "release_date": item.get(date_key, ""),
+                        "popularity": item.get("popularity", 0),
+                        "genre_ids": item.get("genre_ids", []),
+                        "vote_average": item.get("vote_average", 0) or 0,
+                    })
+            return discovered
 
-        return [genre_mapping.get(name, 0) for name in genre_names if name in genre_mapping]
+        except Exception:
+            logger.warning("TMDB discover failed for %s %s", media_type, media_id, exc_info=True)
+            return []
 
     async def _score_recommendations(
         self,
@@ -652,109 +926,150 @@ class RecommendationService:
         8. Similar ratings (low weight)
         9. Same franchise/collection (very high weight)
         10. Release year proximity (low weight)
-        """
-        scored_candidates = []
 
-        for candidate in candidates:
-            if candidate["id"] == source_details["id"]:
-                continue  # Skip the source movie itself
-
-            # Get detailed info for this candidate
-            candidate_details = await self._get_tmdb_details(candidate["id"], media_type)
-            if not candidate_details:
+        Scored candidates also carry the rating and release_year from
+        their details, so callers don't fetch them again.
+        """
+        # Skip the source movie itself
+        candidates = [c for c in candidates if c["id"] != source_details["id"]]
+
+        # Without director/cast/keywords/companies/collection on the source,
+        # candidate details would only add genre, year, rating, budget and
+        # runtime points. The listing payloads cover the first three, so
+        # skip fetching details and drop the budget/runtime factors (15 points)
+        if not any(source_details.get(field) for field in SCORING_SIGNAL_FIELDS):
+            return self._score_from_listings(source_details, candidates)
+
+        # Get detailed info for all candidates concurrently
+        details_list = await _gather_limited(
+            [self._get_tmdb_details(candidate["id"], media_type) for candidate in candidates]
+        )
+
+        # Source-side sets are the same for every candidate, build them once
+        source_sets = [
+            (field, set(source_details.get(field, [])), points, cap)
+            for field, points, cap in OVERLAP_FACTORS
+        ]
+        # Scalar factors need a value on both sides, so decide once which
+        # ones the source can score at all instead of re-checking per candidate
+        source_collection = source_details.get("collection")
+        source_director = source_details.get("director")
+        source_budget = source_details.get("budget", 0)
+        source_runtime = source_details.get("runtime", 0)
+        source_rating = source_details.get("rating", 0)
+        try:
+            source_year = int(source_details.get("release_year", 0))
+        except (ValueError, TypeError):
+            source_year = None
+        match_budget = source_budget > 0
+        match_runtime = source_runtime > 0
+        match_rating = source_rating > 0
+
+        # Sized for every candidate up front; ones without details are
+        # skipped, so the unused tail is trimmed after the loop
+        scored_candidates = [None] * len(candidates)
+        scored_count = 0
+
+        for candidate, candidate_details in zip(candidates, details_list):
+            if not candidate_details or isinstance(candidate_details, BaseException):
                 continue
 
             score = 0.0
 
             # Factor 1: Same franchise/collection (50 points)
-            if source_details.get("collection") and candidate_details.get("collection"):
-                if source_details["collection"] == candidate_details["collection"]:
-                    score += 50
+            if source_collection and source_collection == candidate_details.get("collection"):
+                score += 50
 
             # Factor 2: Same director (30 points)
-            if source_details.get("director") and candidate_details.get("director"):
-                if source_details["director"] == candidate_details["director"]:
-                    score += 30
-
-            # Factor 3: Cast overlap (25 points max)
-            cast_overlap = len(set(source_details.get("cast", [])) & set(candidate_details.get("cast", [])))
-            score += min(cast_overlap * 5, 25)
+            if source_director and source_director == candidate_details.get("director"):
+                score += 30
 
-            # Factor 4: Genre match (20 points max)
-            genre_overlap = len(set(source_details.get("genres", [])) & set(candidate_details.get("genres", [])))
-            score += min(genre_overlap * 10, 20)
-
-            # Factor 5: Keyword overlap (15 points max)
-            keyword_overlap = len(set(source_details.get("keywords", [])) & set(candidate_details.get("keywords", [])))
-            score += min(keyword_overlap * 2, 15)
-
-            # Factor 6: Same production company (15 points max)
-            company_overlap = len(set(source_details.get("companies", [])) & set(candidate_details.get("companies", [])))
-            score += min(company_overlap * 7.5, 15)
+            # Factors 3-6: Cast, genre, keyword and production company overlap
+            for field, source_set, points, cap in source_sets:
+                if source_set:
+                    overlap = len(source_set.intersection(candidate_details.get(field, ())))
+                    score += min(overlap * points, cap)
 
             # Factor 7: Similar budget tier (10 points)
-            if source_details.get("budget", 0) > 0 and candidate_details.get("budget", 0) > 0:
-                budget_ratio = min(source_details["budget"], candidate_details["budget"]) / max(source_details["budget"], candidate_details["budget"])
+            budget = candidate_details.get("budget", 0)
+            if match_budget and budget > 0:
+                budget_ratio = min(source_budget, budget) / max(source_budget, budget)
                 if budget_ratio > 0.5:  # Within same tier
                     score += 10
 
             # Factor 8: Similar runtime (5 points)
-            if source_details.get("runtime", 0) > 0 and candidate_details.get("runtime", 0) > 0:
-                runtime_diff = abs(source_details["runtime"] - candidate_details["runtime"])
-                if runtime_diff < 30:  # Within 30 minutes
+            runtime = candidate_details.get("runtime", 0)
+            if match_runtime and runtime > 0:
+                if abs(source_runtime - runtime) < 30:  # Within 30 minutes
                     score += 5
 
             # Factor 9: Similar ratings (5 points)
-            if source_details.get("rating", 0) > 0 and candidate_details.get("rating", 0) > 0:
-                rating_diff = abs(source_details["rating"] - candidate_details["rating"])
-                if rating_diff < 1.5:  # Within 1.5 points
+            rating = candidate_details.get("rating", 0)
+            if match_rating and rating > 0:
+                if abs(source_rating - rating) < 1.5:  # Within 1.5 points
                     score += 5
 
             # Factor 10: Release year proximity (5 points)
-            try:
-                year_diff = abs(int(source_details.get("release_year", 0)) - int(candidate_details.get("release_year", 0)))
-                if year_diff <= 5:  # Within 5 years
-                    score += 5
-            except (ValueError, TypeError):
-                pass
+            release_year = candidate_details.get("release_year", "")
+            if source_year is not None:
+                try:
+                    if abs(source_year - int(release_year)) <= 5:  # Within 5 years
+                        score += 5
+                except (ValueError, TypeError):
+                    pass
 
             candidate["_score"] = score
-            scored_candidates.append(candidate)
+            candidate["rating"] = rating
+            candidate["release_year"] = release_year
+            scored_candidates[scored_count] = candidate
+            scored_count += 1
+
+        del scored_candidates[scored_count:]
 
         # Sort by score descending
-        scored_candidates.sort(key=lambda x: x.get("_score", 0), reverse=True)
+        scored_candidates.sort(key=itemgetter("_score"), reverse=True)
 
         return scored_candidates
 
-    async def _get_show_thumbnail(self, show_name: str) -> str:
+    def _score_from_listings(self, source_details: Dict, candidates: List[Dict]) -> List[Dict]:
         """
-        Get a thumbnail for a show by searching YouTube.
-        Falls back to placeholder if not found.
+        Score candidates on genre match, rating and release year using only
+        the fields from the similar/discover listings, ranking ties by popularity.
         """
+        source_genre_ids = {
+            GENRE_NAME_TO_ID[name] for name in source_details.get("genres", []) if name in GENRE_NAME_TO_ID
+        }
+        source_rating = source_details.get("rating", 0)
         try:
-            params = {
-                "part": "snippet",
-                "q": f"{show_name} official poster",
-                "type": "video",
-                "maxResults": 1,
-                "key": self.api_key,
-            }
+            source_year = int(source_details.get("release_year", 0))
+        except (ValueError, TypeError):
+            source_year = None
+        match_rating = source_rating > 0
 
-            async with httpx.AsyncClient(timeout=5) as client:
-                response = await client.get(
-                    f"{self.youtube_base_url}/search",
-                    params=params
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    if data.get("items"):
-                        return data["items"][0]["snippet"]["thumbnails"]["high"]["url"]
-        except Exception:
-            pass
+        for candidate in candidates:
+            genre_overlap = len(source_genre_ids.intersection(candidate.get("genre_ids", ())))
+            score = min(genre_overlap * 10, 20)
+
+            # Similar ratings (5 points), as in _score_recommendations
+            rating = candidate.get("vote_average", 0)
+            if match_rating and rating > 0:
+                if abs(source_rating - rating) < 1.5:
+                    score += 5
 
-        # Fallback placeholder
-        return "https://via.placeholder.com/480x360/831010/ffffff?text=TV+Show"
+            release_year = (candidate.get("release_date") or "")[:4]
+            if source_year is not None:
+                try:
+                    if abs(source_year - int(release_year)) <= 5:
+                        score += 5
+                except (ValueError, TypeError):
+                    pass
 
+            candidate["_score"] = score
+            candidate["rating"] = rating
+            candidate["release_year"] = release_year
+
+        candidates.sort(key=itemgetter("_score", "popularity"), reverse=True)
+        return candidates
 
     async def _search_youtube_content(
         self,
@@ -766,6 +1081,16 @@ class RecommendationService:
         """
         Search YouTube for trailers, reviews, and related content.
         """
+        results = await _single_flight(
+            youtube_search_cache,
+            (query, region, category, limit),
+            lambda: self._fetch_youtube_content(query, region, limit),
+        )
+        # Callers own the returned results, so keep the cached ones isolated
+        return [dict(r) for r in results] if results else []
+
+    async def _fetch_youtube_content(self, query: str, region: str, limit: int) -> Optional[List[Dict]]:
+        """Returns None if the search failed, so the miss isn't cached"""
         params = {
             "part": "snippet",
             "q": query,
@@ -776,169 +1101,97 @@ class RecommendationService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.youtube_base_url}/search",
-                    params=params
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await self._youtube_search(params)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
 
-                results = []
-                for item in data.get("items", []):
-                    video_id = item["id"].get("videoId")
-                    if not video_id:
-                        continue
-
-                    results.append({
-                        "id": video_id,
-                        "title": item["snippet"]["title"],
-                        "description": item["snippet"]["description"],
-                        "thumbnail": item["snippet"]["thumbnails"]["high"]["url"],
-                        "channel": item["snippet"]["channelTitle"],
-                        "published_at": item["snippet"]["publishedAt"],
-                        "platform": "youtube",
-                        "url": f"https://www.youtube.com/watch?v={video_id}",
-                    })
+            results = []
+            for item in data.get("items", []):
+                transformed = self._transform_youtube_item(item)
+                if transformed:
+                    results.append(transformed)
 
-                return results
+            return results
 
         except Exception:
-            return []
+            return None
 
     def _get_mock_youtube_results(self, query: str) -> List[Dict]:
         """Fallback mock data with REAL working YouTube videos"""
-        # Popular YouTube videos that actually work
-        videos = [
-            ("MrBeast - $1 vs $500,000 Experiences", "jk7GA4EZZrw", "https://i.ytimg.com/vi/jk7GA4EZZrw/hqdefault.jpg", "MrBeast"),
-            ("Mark Rober - Glitter Bomb 5.0", "h4T_LlK1VE4", "https://i.ytimg.com/vi/h4T_LlK1VE4/hqdefault.jpg", "Mark Rober"),
-            ("Veritasium - The Most Powerful Computers", "IxkSlnrRFqc", "https://i.ytimg.com/vi/IxkSlnrRFqc/hqdefault.jpg", "Veritasium"),
-            ("Marques Brownlee - iPhone 15 Review", "TUXpoM9OY3M", "https://i.ytimg.com/vi/TUXpoM9OY3M/hqdefault.jpg", "MKBHD"),
-            ("Kurzgesagt - What if You Detonated a Nuclear Bomb", "5iPH-br_eJQ", "https://i.ytimg.com/vi/5iPH-br_eJQ/hqdefault.jpg", "Kurzgesagt"),
-            ("Vsauce - What If Everyone Jumped at Once", "jHbyQ_AQP8c", "https://i.ytimg.com/vi/jHbyQ_AQP8c/hqdefault.jpg", "Vsauce"),
-            ("Dude Perfect - Extreme Hide and Seek", "rf0Lsjewg8c", "https://i.ytimg.com/vi/rf0Lsjewg8c/hqdefault.jpg", "Dude Perfect"),
-            ("Casey Neistat - DO WHAT YOU CAN'T", "jG7dSXcfVqE", "https://i.ytimg.com/vi/jG7dSXcfVqE/hqdefault.jpg", "Casey Neistat"),
-        ]
-
-        return [
-            {
-                "id": video_id,
-                "title": title,
-                "description": f"Popular video about {query}",
-                "thumbnail": thumbnail,
-                "channel": channel,
-                "published_at": "2024-01-15T12:00:00Z",
-                "platform": "youtube",
-                "url": f"https://www.youtube.com/watch?v={video_id}",
-            }
-            for title, video_id, thumbnail, channel in videos
-        ]
+        template = {
+            **MOCK_RESULT_TEMPLATE,
+            "description": f"Popular video about {query}",
+            "published_at": MOCK_PUBLISHED_AT,
+            "platform": "youtube",
+        }
+        results = []
+        for title, video_id, thumbnail, channel, watch_url in MOCK_YOUTUBE_VIDEOS:
+            result = template.copy()
+            result["id"] = video_id
+            result["title"] = title
+            result["thumbnail"] = thumbnail
+            result["channel"] = channel
+            result["url"] = watch_url
+            results.append(result)
+        return results
 
     def _get_mock_shorts_results(self, query: str) -> List[Dict]:
         """Fallback mock data with REAL working YouTube Shorts"""
-        # Real popular YouTube Shorts that work
-        shorts = [
-            ("Labubu Unboxing #1", "nXA_f0xBSjw", "https://i.ytimg.com/vi/nXA_f0xBSjw/hqdefault.jpg", "Toy Reviews"),
-            ("Labubu Collection Tour", "8VGF-rQqF7Q", "https://i.ytimg.com/vi/8VGF-rQqF7Q/hqdefault.jpg", "Collectibles Hub"),
-            ("Viral Dance Trend", "2g6J6vT5mBU", "https://i.ytimg.com/vi/2g6J6vT5mBU/hqdefault.jpg", "TikTok Dancer"),
-            ("Funny Cat Moment", "J---aiyznGQ", "https://i.ytimg.com/vi/J---aiyznGQ/hqdefault.jpg", "Cat Lover"),
-            ("Quick Recipe Hack", "0FTw0UHb3vw", "https://i.ytimg.com/vi/0FTw0UHb3vw/hqdefault.jpg", "Food Shorts"),
-            ("Life Hack You Need", "dQw4w9WgXcQ", "https://i.ytimg.com/vi/dQw4w9WgXcQ/hqdefault.jpg", "Daily Tips"),
-            ("Satisfying Video", "9bZkp7q19f0", "https://i.ytimg.com/vi/9bZkp7q19f0/hqdefault.jpg", "Oddly Satisfying"),
-            ("Epic Fail Compilation", "K5le9sYdYkM", "https://i.ytimg.com/vi/K5le9sYdYkM/hqdefault.jpg", "Fail Army"),
-            ("Magic Trick Revealed", "YbJOTdZBX1g", "https://i.ytimg.com/vi/YbJOTdZBX1g/hqdefault.jpg", "Magic Show"),
-            ("Cute Puppy Reaction", "2Vv-BfVoq4g", "https://i.ytimg.com/vi/2Vv-BfVoq4g/hqdefault.jpg", "Pet Channel"),
-        ]
-
-        return [
-            {
-                "id": video_id,
-                "title": title,
-                "description": f"Viral {query} content",
-                "thumbnail": thumbnail,
-                "channel": channel,
-                "published_at": "2024-01-15T12:00:00Z",
-                "platform": "tiktok",
-                "url": f"https://www.youtube.com/watch?v={video_id}",
-            }
-            for title, video_id, thumbnail, channel in shorts
-        ]
+        template = {
+            **MOCK_RESULT_TEMPLATE,
+            "description": f"Viral {query} content",
+            "published_at": MOCK_PUBLISHED_AT,
+            "platform": "tiktok",
+        }
+        results = []
+        for title, video_id, thumbnail, channel, watch_url in MOCK_SHORTS:
+            result = template.copy()
+            result["id"] = video_id
+            result["title"] = title
+            result["thumbnail"] = thumbnail
+            result["channel"] = channel
+            result["url"] = watch_url
+            results.append(result)
+        return results
 
     def _get_mock_movie_results(self, query: str, category: str) -> List[Dict]:
         """Fallback mock data for movies/TV with REAL working YouTube video IDs"""
-
-        # Real YouTube video IDs for popular movie/TV trailers
-        recommendations = {
-            "avengers": [
-                ("Iron Man Official Trailer", "8ugaeA-nMTc", "https://i.ytimg.com/vi/8ugaeA-nMTc/hqdefault.jpg"),
-                ("Captain America: Winter Soldier Trailer", "7SlILk2WMTI", "https://i.ytimg.com/vi/7SlILk2WMTI/hqdefault.jpg"),
-                ("Thor Official Trailer", "JOddp-nlNvQ", "https://i.ytimg.com/vi/JOddp-nlNvQ/hqdefault.jpg"),
-                ("Guardians of the Galaxy Trailer", "d96cjJhvlMA", "https://i.ytimg.com/vi/d96cjJhvlMA/hqdefault.jpg"),
-                ("Black Panther Official Trailer", "xjDjIWPwcPU", "https://i.ytimg.com/vi/xjDjIWPwcPU/hqdefault.jpg"),
-                ("Doctor Strange Trailer", "HSzx-zryEgM", "https://i.ytimg.com/vi/HSzx-zryEgM/hqdefault.jpg"),
-            ],
-            "inception": [
-                ("Interstellar Trailer", "zSWdZVtXT7E", "https://i.ytimg.com/vi/zSWdZVtXT7E/hqdefault.jpg"),
-                ("Shutter Island Trailer", "5iaYLCiq5RM", "https://i.ytimg.com/vi/5iaYLCiq5RM/hqdefault.jpg"),
-                ("The Prestige Trailer", "o4gHCmTQDVI", "https://i.ytimg.com/vi/o4gHCmTQDVI/hqdefault.jpg"),
-                ("Memento Trailer", "HDWylEQSwFo", "https://i.ytimg.com/vi/HDWylEQSwFo/hqdefault.jpg"),
-                ("Tenet Trailer", "AZGcmvrTX9M", "https://i.ytimg.com/vi/AZGcmvrTX9M/hqdefault.jpg"),
-                ("The Matrix Trailer", "m8e-FF8MsqU", "https://i.ytimg.com/vi/m8e-FF8MsqU/hqdefault.jpg"),
-            ],
-            "spider-man": [
-                ("Spider-Man: No Way Home", "JfVOs4VSpmA", "https://i.ytimg.com/vi/JfVOs4VSpmA/hqdefault.jpg"),
-                ("Spider-Man: Into the Spider-Verse", "g4Hbz2jLxvQ", "https://i.ytimg.com/vi/g4Hbz2jLxvQ/hqdefault.jpg"),
-                ("The Amazing Spider-Man", "DyLUwOcR5pk", "https://i.ytimg.com/vi/DyLUwOcR5pk/hqdefault.jpg"),
-                ("Spider-Man: Homecoming", "rk-dF1lIbIg", "https://i.ytimg.com/vi/rk-dF1lIbIg/hqdefault.jpg"),
-                ("Spider-Man: Far From Home", "Nt9L1jCKGnE", "https://i.ytimg.com/vi/Nt9L1jCKGnE/hqdefault.jpg"),
-                ("Venom", "u9Mv98Gr5pY", "https://i.ytimg.com/vi/u9Mv98Gr5pY/hqdefault.jpg"),
-            ],
-            "batman": [
-                ("The Batman Trailer", "mqqft2x_Aa4", "https://i.ytimg.com/vi/mqqft2x_Aa4/hqdefault.jpg"),
-                ("The Dark Knight Trailer", "EXeTwQWrcwY", "https://i.ytimg.com/vi/EXeTwQWrcwY/hqdefault.jpg"),
-                ("Batman Begins Trailer", "neY2xVmOfUM", "https://i.ytimg.com/vi/neY2xVmOfUM/hqdefault.jpg"),
-                ("Joker Trailer", "zAGVQLHvwOY", "https://i.ytimg.com/vi/zAGVQLHvwOY/hqdefault.jpg"),
-                ("Justice League Trailer", "3cxixDgHUYw", "https://i.ytimg.com/vi/3cxixDgHUYw/hqdefault.jpg"),
-                ("Superman Man of Steel", "T6DJcgm3wNY", "https://i.ytimg.com/vi/T6DJcgm3wNY/hqdefault.jpg"),
-            ],
-        }
-
         # Find relevant recommendations
         query_lower = query.lower()
 
-        # Try exact match first
-        if query_lower in recommendations:
-            videos = recommendations[query_lower]
-        else:
-            # Partial match or default
-            for key in recommendations:
-                if key in query_lower or query_lower in key:
-                    videos = recommendations[key]
+        # Try exact match first, then any query word naming a franchise
+        videos = MOCK_MOVIE_TRAILERS.get(query_lower)
+        if videos is None:
+            for word in query_lower.split():
+                videos = MOCK_MOVIE_TRAILERS.get(word)
+                if videos is not None:
                     break
             else:
-                # Default popular trailers
-                videos = [
-                    ("Dune: Part Two Trailer", "Way9Dexny3w", "https://i.ytimg.com/vi/Way9Dexny3w/hqdefault.jpg"),
-                    ("Oppenheimer Trailer", "uYPbbksJxIg", "https://i.ytimg.com/vi/uYPbbksJxIg/hqdefault.jpg"),
-                    ("Barbie Trailer", "pBk4NYhWNMM", "https://i.ytimg.com/vi/pBk4NYhWNMM/hqdefault.jpg"),
-                    ("Deadpool & Wolverine", "73_1biulkYk", "https://i.ytimg.com/vi/73_1biulkYk/hqdefault.jpg"),
-                    ("The Marvels Trailer", "wS_qbDztgVY", "https://i.ytimg.com/vi/wS_qbDztgVY/hqdefault.jpg"),
-                    ("Top Gun: Maverick", "giXco2jaZ_4", "https://i.ytimg.com/vi/giXco2jaZ_4/hqdefault.jpg"),
-                ]
-
-        return [
-            {
-                "id": video_id,
-                "title": title,
-                "description": f"Watch the official trailer",
-                "thumbnail": thumbnail,
-                "channel": "Official Movie Trailers",
-                "published_at": "2024-01-10T12:00:00Z",
-                "platform": category,
-                "url": f"https://www.youtube.com/watch?v={video_id}",
-            }
-            for title, video_id, thumbnail in videos
-        ]
+                # Partial match (e.g. "spider" or "the bat") or default
+                for key in MOCK_MOVIE_TRAILERS:
+                    if key in query_lower or query_lower in key:
+                        videos = MOCK_MOVIE_TRAILERS[key]
+                        break
+                else:
+                    # Default popular trailers
+                    videos = MOCK_DEFAULT_TRAILERS
+
+        template = {
+            **MOCK_RESULT_TEMPLATE,
+            "description": "Watch the official trailer",
+            "channel": "Official Movie Trailers",
+            "published_at": MOCK_TRAILER_PUBLISHED_AT,
+            "platform": category,
+        }
+        results = []
+        for title, video_id, thumbnail, watch_url in videos:
+            result = template.copy()
+            result["id"] = video_id
+            result["title"] = title
+            result["thumbnail"] = thumbnail
+            result["url"] = watch_url
+            results.append(result)
+        return results
 
     def _score_and_rank(self, results: List[Dict]) -> List[Dict]:
         """
@@ -949,31 +1202,36 @@ class RecommendationService:
         if not results:
             return []
 
-        # Score each result
-        for result in results:
-            score = 0.0
+        now_utc = datetime.now(timezone.utc)
+        rand = random.random
 
-            # Recency boost (newer content gets a small bump)
-            try:
-                published = datetime.fromisoformat(
-                    result["published_at"].replace("Z", "+00:00")
-                )
-                days_old = (datetime.now(published.tzinfo) - published).days
-                recency_score = max(0, 1 - (days_old / 365))  # Decays over a year
-                score += recency_score * 0.7
-            except Exception:
-                pass
+        # Recency boost per distinct published_at; results mostly share a
+        # handful of them (every mock result has the same one)
+        recency_boosts: Dict[Any, float] = {}
+
+        # Scores are kept in a parallel list so the result dicts are never touched
+        scores = []
+        for result in results:
+            published_at = result.get("published_at")
+            score = recency_boosts.get(published_at)
+            if score is None:
+                score = 0.0
+
+                # Recency boost (newer content gets a small bump)
+                try:
+                    published = _parse_timestamp(published_at)
+                    days_old = (now_utc - published).days
+                    recency_score = max(0, 1 - (days_old / 365))  # Decays over a year
+                    score += recency_score * 0.7
+                except Exception:
+                    pass
+                recency_boosts[published_at] = score
 
             # Add randomness for diversity
-            score += random.random() * 0.3
+            score += rand() * 0.3
 
-            result["_score"] = score
+            scores.append(score)
 
         # Sort by score descending
-        results.sort(key=lambda x: x.get("_score", 0), reverse=True)
-
-        # Remove the internal score field before returning
-        for result in results:
-            result.pop("_score", None)
-
-        return results
+        order = sorted(range(len(results)), key=scores.__getitem__, reverse=True)
+        return [results[i] for i in order]
@@ -0,0 +1,92 @@
+import asyncio
+import logging
+from typing import Dict, Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import cache
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import UserInteraction
+
+logger = logging.getLogger(__name__)
+
+STATS_KEY = "stats:summary"
+
+# Latest summary computed by this worker
+_latest_summary: Optional[Dict] = None
+
+
+async def compute_stats(db: AsyncSession) -> Dict:
+    """
+    Aggregate the interactions table into the /stats summary.
+    """
+    # One grouped query returns per-category totals and clicks;
+    # COUNT(clicked_video_id) skips NULLs, so it only counts clicks.
+    # Overall totals are summed from the groups rather than via ROLLUP,
+    # which SQLite doesn't support.
+    # Streamed in chunks (server-side cursor on Postgres) so memory stays
+    # bounded if the grouping ever gets high-cardinality
+    result = await db.stream(
+        select(
+            UserInteraction.category,
+            func.count(UserInteraction.id).label("count"),
+            func.count(UserInteraction.clicked_video_id).label("clicks"),
+        )
+        .group_by(UserInteraction.category)
+        .execution_options(yield_per=1000)
+    )
+
+    total_interactions = 0
+    total_clicks = 0
+    category_counts = {}
+    async for row in result.mappings():
+        category_counts[row["category"]] = row["count"]
+        total_interactions += row["count"]
+        total_clicks += row["clicks"]
+
+    return {
+        "total_interactions": total_interactions,
+        "total_clicks": total_clicks,
+        "click_through_rate": (
+            round(total_clicks / total_interactions * 100, 2)
+            if total_interactions > 0 else 0
+        ),
+        "category_breakdown": category_counts,
+    }
+
+
+async def _publish(summary: Dict):
+    global _latest_summary
+    _latest_summary = summary
+    # Expire in Redis if refreshes stop, so workers don't serve a stale summary forever
+    await cache.set_shared(STATS_KEY, summary, ttl=settings.stats_refresh_seconds * 2)
+
+
+async def refresh_stats_periodically():
+    """
+    Background task started from the app lifespan.
+    Recomputes the summary every STATS_REFRESH_SECONDS so /stats never scans the table.
+    """
+    while True:
+        try:
+            async with AsyncSessionLocal() as session:
+                await _publish(await compute_stats(session))
+        except Exception:
+            logger.exception("Failed to refresh stats summary")
+        await asyncio.sleep(settings.stats_refresh_seconds)
+
+
+async def get_stats_summary(db: AsyncSession) -> Dict:
+    """
+    Return the precomputed summary, computing it on demand
+    only if no refresh has happened yet.
+    """
+    summary = await cache.get_shared(STATS_KEY)
+    if summary is None:
+        summary = _latest_summary
+    if summary is None:
+        summary = await compute_stats(db)
+        await _publish(summary)
+    return summary
@@ -0,0 +1,95 @@
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpen(Exception):
+    """The upstream is backing off, so the call was skipped"""
+
+
+class AdaptiveLimiter:
+    """
+    Concurrency limit for calls to a rate-limited upstream API (AIMD).
+    The limit grows by one after each fast success and halves on
+    429/5xx responses or errors. A 403/429 also opens a circuit breaker
+    for Retry-After (or cooldown) seconds, and calls fail fast with
+    CircuitOpen until it closes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial: int = 8,
+        minimum: int = 2,
+        maximum: int = 64,
+        target_latency: float = 1.0,
+        cooldown: float = 30,
+    ):
+        self.name = name
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.cooldown = cooldown
+        self._in_flight = 0
+        self._condition = asyncio.Condition()
+        self._open_until = 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return time.monotonic() < self._open_until
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        Hold one of the current `limit` slots for the duration of a call.
+        Raises CircuitOpen instead of waiting while the breaker is open,
+        including for callers already queued when it opens.
+        """
+        if self.is_open:
+            raise CircuitOpen(self.name)
+
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.is_open or self._in_flight < self.limit)
+            # The breaker may have opened while we were queued for a slot
+            if self.is_open:
+                raise CircuitOpen(self.name)
+            self._in_flight += 1
+        try:
+            yield
+        except Exception:
+            self._decrease()
+            raise
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def record(self, status_code: int, latency: float, retry_after: Optional[str] = None):
+        """Adjust the limit (and breaker) from a completed response"""
+        if status_code in (403, 429):
+            self._decrease()
+            self._open(retry_after)
+        elif status_code >= 500:
+            self._decrease()
+        elif status_code < 400 and latency <= self.target_latency:
+            self.limit = min(self.maximum, self.limit + 1)
+
+    def _decrease(self):
+        self.limit = max(self.minimum, self.limit // 2)
+
+    def open_for(self, seconds: float):
+        """Skip calls for the next `seconds`, e.g. until a quota resets"""
+        self._open_until = max(self._open_until, time.monotonic() + seconds)
+        logger.warning("%s is rate limiting, skipping calls for %.0fs", self.name, seconds)
+
+    def _open(self, retry_after: Optional[str]):
+        try:
+            delay = float(retry_after) if retry_after else self.cooldown
+        except ValueError:
+            delay = self.cooldown  # HTTP-date form, not worth parsing
+        self.open_for(delay)
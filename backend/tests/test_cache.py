@@ -0,0 +1,47 @@
+import asyncio
+
+from app import cache
+
+
+def test_local_get_or_set_survives_loader_cancellation():
+    cache.local_cache.clear()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def main():
+        owner = asyncio.create_task(cache._local_get_or_set("k", 60, loader))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache._local_get_or_set("k", 60, loader))
+        await asyncio.sleep(0)
+        owner.cancel()
+        value, _hit = await waiter
+        return owner.cancelled(), waiter.cancelled(), value
+
+    owner_cancelled, waiter_cancelled, value = asyncio.run(main())
+
+    assert owner_cancelled
+    assert not waiter_cancelled
+    # The waiter ran the load itself after the owner went away
+    assert value == 2
+    assert cache.local_cache["k"][0] == 2
+
+
+def test_single_flight_shares_concurrent_loads():
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def main():
+        return await asyncio.gather(*(cache.single_flight("shared", loader) for _ in range(3)))
+
+    results = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert results == [("value", False), ("value", True), ("value", True)]
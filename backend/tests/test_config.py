@@ -0,0 +1,27 @@
+import pytest
+from pydantic import ValidationError
+
+from app.config import Settings
+
+
+def test_allowed_origins_parsed_from_comma_separated_string():
+    settings = Settings(allowed_origins=" https://a.example, http://localhost:5173,")
+
+    assert settings.allowed_origins == ["https://a.example", "http://localhost:5173"]
+
+
+def test_malformed_allowed_origin_fails_validation():
+    with pytest.raises(ValidationError):
+        Settings(allowed_origins="https://a.example,a.example")
+
+
+def test_category_cache_ttls_parsed_once():
+    settings = Settings(cache_ttl=180, category_cache_ttls="movies=3600, tv=600")
+
+    assert settings.cache_ttl_for("tv") == 600
+    assert settings.cache_ttl_for("youtube") == 180
+
+
+def test_malformed_category_cache_ttl_fails_validation():
+    with pytest.raises(ValidationError):
+        Settings(category_cache_ttls="movies=1h")
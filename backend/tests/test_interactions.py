@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app import interactions
+from app.database import Base
+from app.interactions import InteractionBuffer
+from app.models import UserInteraction
+
+
+def make_row(i: int) -> dict:
+    return {
+        "category": "youtube",
+        "search_query": f"query {i}",
+        "region": "US",
+        "recommendations": ["a", "b"],
+        "clicked_video_id": None,
+        "clicked_position": None,
+        "session_id": "session",
+    }
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """
+    Point the buffer at a fresh SQLite file. Returns a helper that runs
+    an async function against it and returns (result, rows written).
+    """
+    def run(coro_fn):
+        async def main():
+            engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'interactions.db'}")
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            sessions = async_sessionmaker(engine, expire_on_commit=False)
+            monkeypatch.setattr(interactions, "AsyncSessionLocal", sessions)
+            try:
+                result = await coro_fn()
+                async with sessions() as session:
+                    count = await session.scalar(select(func.count(UserInteraction.id)))
+                return result, count
+            finally:
+                await engine.dispose()
+
+        return asyncio.run(main())
+
+    return run
+
+
+def test_put_reports_a_full_buffer():
+    buffer = InteractionBuffer(batch_size=10, batch_ms=10, max_queued=2)
+
+    assert buffer.put(make_row(0))
+    assert buffer.put(make_row(1))
+    assert not buffer.put(make_row(2))
+    assert buffer.queue.qsize() == 2
+
+
+def test_flush_writes_one_batch(database):
+    buffer = InteractionBuffer(batch_size=3, batch_ms=10, max_queued=100)
+    for i in range(5):
+        buffer.put(make_row(i))
+
+    _, written = database(buffer.flush)
+
+    assert written == 3
+    assert buffer.queue.qsize() == 2
+
+
+def test_drain_writes_everything_queued(database):
+    buffer = InteractionBuffer(batch_size=3, batch_ms=10, max_queued=100)
+    for i in range(7):
+        buffer.put(make_row(i))
+
+    _, written = database(buffer.drain)
+
+    assert written == 7
+    assert buffer.queue.empty()
+
+
+def test_run_flushes_rows_in_the_background(database):
+    buffer = InteractionBuffer(batch_size=50, batch_ms=10, max_queued=100)
+
+    async def run_briefly():
+        task = asyncio.create_task(buffer.run())
+        for i in range(4):
+            buffer.put(make_row(i))
+        await asyncio.sleep(0.2)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    _, written = database(run_briefly)
+
+    assert written == 4
+    assert buffer.queue.empty()
+
+
+def test_cancelled_flush_requeues_its_batch(monkeypatch):
+    class HangingSession:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        def begin(self):
+            return self
+
+        async def execute(self, *args):
+            await asyncio.sleep(3600)
+
+    monkeypatch.setattr(interactions, "AsyncSessionLocal", HangingSession)
+    buffer = InteractionBuffer(batch_size=3, batch_ms=10, max_queued=100)
+    for i in range(5):
+        buffer.put(make_row(i))
+
+    async def cancel_mid_write():
+        task = asyncio.create_task(buffer.flush())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_mid_write())
+
+    # The 3 rows taken for the batch went back on the queue for drain()
+    assert buffer.queue.qsize() == 5
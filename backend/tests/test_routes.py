@@ -4,6 +4,26 @@ from app.main import app
 
 client = TestClient(app)
 
+
+@pytest.fixture
+def fake_service(monkeypatch):
+    """
+    Serve /recommendations from a fake service with empty caches.
+    Returns the kwargs of every get_recommendations call.
+    """
+    from app import routes
+
+    calls = []
+
+    class FakeService:
+        async def get_recommendations(self, **kwargs):
+            calls.append(kwargs)
+            return [{"id": kwargs["search_query"], "title": "Result"}]
+
+    monkeypatch.setitem(app.dependency_overrides, routes.get_recommendation_service, FakeService)
+    routes.cache.local_cache.clear()
+    return calls
+
 def test_health_check():
     response = client.get("/api/health")
     assert response.status_code == 200
@@ -15,7 +35,7 @@ def test_recommendations_invalid_category():
         "searchQuery": "test",
         "region": "US"
     })
-    assert response.status_code == 400
+    assert response.status_code == 422
 
 def test_recommendations_empty_query():
     response = client.post("/api/recommendations", json={
@@ -24,3 +44,83 @@ def test_recommendations_empty_query():
         "region": "US"
     })
     assert response.status_code == 422
+
+def test_recommendations_cached_on_repeat(fake_service):
+    payload = {"category": "youtube", "searchQuery": "cats", "region": "US"}
+    first = client.post("/api/recommendations", json=payload)
+    second = client.post("/api/recommendations", json={**payload, "searchQuery": "  Cats "})
+
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json()["results"] == first.json()["results"]
+    assert len(fake_service) == 1
+
+
+def test_recommendations_reuse_near_duplicate_query(fake_service):
+    payload = {"category": "youtube", "searchQuery": "funny cat videos", "region": "US"}
+    first = client.post("/api/recommendations", json=payload)
+    second = client.post("/api/recommendations", json={**payload, "searchQuery": "cat funny videos"})
+
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert len(fake_service) == 1
+
+
+@pytest.mark.parametrize("first_query,second_query", [
+    ("funny cat videos", "cat funny vids"),
+    ("iphone review", "iPhone reviews"),
+    ("chess openings", "chess opening"),
+])
+def test_recommendations_reuse_plural_and_abbreviated_query(fake_service, first_query, second_query):
+    payload = {"category": "youtube", "searchQuery": first_query, "region": "US"}
+    first = client.post("/api/recommendations", json=payload)
+    second = client.post("/api/recommendations", json={**payload, "searchQuery": second_query})
+
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "HIT"
+    assert len(fake_service) == 1
+
+
+def test_recommendations_near_duplicate_with_different_number_misses(fake_service):
+    payload = {"category": "youtube", "searchQuery": "toy story 2", "region": "US"}
+    first = client.post("/api/recommendations", json=payload)
+    second = client.post("/api/recommendations", json={**payload, "searchQuery": "toy story 3"})
+
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "MISS"
+    assert second.json()["results"][0]["id"] == "toy story 3"
+    assert len(fake_service) == 2
+
+
+def test_movie_recommendations_keep_word_order_in_cache_key(fake_service):
+    payload = {"category": "movies", "searchQuery": "godfather the", "region": "US"}
+    first = client.post("/api/recommendations", json=payload)
+    second = client.post("/api/recommendations", json={**payload, "searchQuery": "the godfather"})
+
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "MISS"
+    assert len(fake_service) == 2
+
+
+def test_recommendations_not_cached_when_disabled(monkeypatch):
+    from app import routes, services
+    from app.services import RecommendationService
+
+    async def fake_youtube(self, search_query, region):
+        fetched.append(search_query)
+        return [{"id": "abc", "title": "Cats", "published_at": ""}]
+
+    fetched = []
+    monkeypatch.setattr(routes.settings, "cache_enabled", False)
+    monkeypatch.setattr(RecommendationService, "_get_youtube_recommendations", fake_youtube)
+    service = RecommendationService()
+    monkeypatch.setitem(app.dependency_overrides, routes.get_recommendation_service, lambda: service)
+    services.recommendation_cache.clear()
+
+    payload = {"category": "youtube", "searchQuery": "cats", "region": "US"}
+    first = client.post("/api/recommendations", json=payload)
+    second = client.post("/api/recommendations", json=payload)
+
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.headers["X-Cache"] == "MISS"
+    assert fetched == ["cats", "cats"]
@@ -0,0 +1,117 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app import services
+from app.services import RecommendationService
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    for cache in (
+        services.recommendation_cache,
+        services.tmdb_details_cache,
+        services.tmdb_similar_cache,
+        services.tmdb_search_cache,
+        services.tmdb_providers_cache,
+        services.youtube_search_cache,
+    ):
+        cache.clear()
+
+
+def make_service(handler) -> RecommendationService:
+    return RecommendationService(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+def tmdb_handler(request: httpx.Request) -> httpx.Response:
+    """Fake TMDB: one source movie with two similar titles on different platforms"""
+    path = request.url.path
+    append = request.url.params.get("append_to_response")
+
+    if path == "/3/search/movie":
+        return httpx.Response(200, json={"results": [{"id": 1, "title": "Source", "release_date": "2019-05-01"}]})
+    if path == "/3/movie/1/similar":
+        return httpx.Response(200, json={"results": [
+            {"id": 2, "title": "Close Match", "popularity": 50, "genre_ids": [28],
+             "vote_average": 7.2, "release_date": "2018-01-01"},
+            {"id": 3, "title": "Far Off", "popularity": 40, "genre_ids": [18],
+             "vote_average": 3.0, "release_date": "1990-01-01"},
+        ]})
+    if path == "/3/discover/movie":
+        return httpx.Response(200, json={"results": []})
+    if path == "/3/movie/1" and append == "credits,keywords":
+        return httpx.Response(200, json={
+            "title": "Source", "genres": [{"name": "Action"}], "vote_average": 7.0, "release_date": "2019-05-01",
+        })
+    if append == "watch/providers":
+        flatrate = {
+            "/3/movie/2": [{"provider_id": 9}, {"provider_id": 337}],  # Prime, Disney+
+            "/3/movie/3": [{"provider_id": 8}],  # Netflix
+        }.get(path, [])
+        return httpx.Response(200, json={
+            "title": "Title", "watch/providers": {"results": {"US": {"flatrate": flatrate}}},
+        })
+    return httpx.Response(404)
+
+
+def test_similar_shows_use_highest_ranked_platform():
+    service = make_service(tmdb_handler)
+
+    shows = asyncio.run(service._find_similar_shows("Source", "movies"))
+
+    assert [show["id"] for show in shows] == ["2", "3"]
+    # Disney+ outranks Prime even though TMDB listed Prime first
+    assert shows[0]["platform"] == "disney"
+    assert shows[0]["all_platforms"] == ["prime", "disney"]
+    assert shows[1]["platform"] == "netflix"
+
+
+def test_youtube_results_skip_malformed_items():
+    def handler(request):
+        return httpx.Response(200, json={"items": [
+            {"id": {"kind": "youtube#channel"}},
+            {"id": {"videoId": "bare"}},
+            {"id": {"videoId": "full"}, "snippet": {
+                "title": "Full", "channelTitle": "Channel", "thumbnails": {"high": {"url": "https://img"}},
+            }},
+        ]})
+
+    service = make_service(handler)
+
+    results = asyncio.run(service._get_youtube_recommendations("cats", "US"))
+
+    # The channel item is dropped and the item without a snippet comes back
+    # with empty fields, instead of the whole search falling back to mocks
+    assert [result["id"] for result in results] == ["bare", "full"]
+    assert results[0]["title"] == ""
+    assert results[1]["thumbnail"] == "https://img"
+
+
+def test_score_from_listings_scores_genre_rating_and_year():
+    service = make_service(tmdb_handler)
+    source = {"id": 1, "genres": ["Action", "Comedy"], "rating": 7.0, "release_year": "2019"}
+    candidates = [
+        {"id": 2, "genre_ids": [], "vote_average": 3.0, "release_date": "1990-01-01", "popularity": 90},
+        {"id": 3, "genre_ids": [28, 35], "vote_average": 7.5, "release_date": "2021-02-02", "popularity": 10},
+        {"id": 4, "genre_ids": [28], "vote_average": 0, "release_date": "", "popularity": 20},
+    ]
+
+    scored = service._score_from_listings(source, candidates)
+
+    assert [(c["id"], c["_score"]) for c in scored] == [(3, 30), (4, 10), (2, 0)]
+    assert scored[0]["rating"] == 7.5
+    assert scored[0]["release_year"] == "2021"
+
+
+def test_score_from_listings_without_source_year_or_rating():
+    service = make_service(tmdb_handler)
+    candidates = [
+        {"id": 2, "genre_ids": [], "vote_average": 7.0, "release_date": "2020-01-01", "popularity": 5},
+        {"id": 3, "genre_ids": [], "vote_average": 7.0, "release_date": "2020-01-01", "popularity": 9},
+    ]
+
+    scored = service._score_from_listings({"id": 1, "release_year": ""}, candidates)
+
+    # No points on either side, so popularity breaks the tie
+    assert [(c["id"], c["_score"]) for c in scored] == [(3, 0), (2, 0)]
@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from app import throttle
+from app.throttle import AdaptiveLimiter, CircuitOpen
+
+
+def test_fast_success_grows_limit_up_to_maximum():
+    limiter = AdaptiveLimiter("test", initial=3, maximum=4, target_latency=1.0)
+
+    limiter.record(200, latency=0.1)
+    limiter.record(200, latency=0.1)
+
+    assert limiter.limit == 4
+
+
+def test_slow_success_keeps_limit():
+    limiter = AdaptiveLimiter("test", initial=8, target_latency=1.0)
+
+    limiter.record(200, latency=2.0)
+
+    assert limiter.limit == 8
+
+
+def test_server_error_halves_limit_down_to_minimum():
+    limiter = AdaptiveLimiter("test", initial=8, minimum=3)
+
+    limiter.record(503, latency=0.1)
+    assert limiter.limit == 4
+    limiter.record(500, latency=0.1)
+    assert limiter.limit == 3
+    assert not limiter.is_open
+
+
+def test_error_inside_slot_halves_limit():
+    limiter = AdaptiveLimiter("test", initial=8)
+
+    async def main():
+        with pytest.raises(RuntimeError):
+            async with limiter.slot():
+                raise RuntimeError("boom")
+
+    asyncio.run(main())
+
+    assert limiter.limit == 4
+    assert limiter._in_flight == 0
+
+
+def test_rate_limit_opens_breaker_for_retry_after(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(throttle.time, "monotonic", lambda: now[0])
+    limiter = AdaptiveLimiter("test", initial=8, cooldown=30)
+
+    limiter.record(429, latency=0.1, retry_after="5")
+
+    assert limiter.limit == 4
+    assert limiter.is_open
+    now[0] += 5
+    assert not limiter.is_open
+
+
+@pytest.mark.parametrize("retry_after", [None, "Wed, 21 Oct 2015 07:28:00 GMT"])
+def test_rate_limit_without_numeric_retry_after_uses_cooldown(monkeypatch, retry_after):
+    now = [1000.0]
+    monkeypatch.setattr(throttle.time, "monotonic", lambda: now[0])
+    limiter = AdaptiveLimiter("test", cooldown=30)
+
+    limiter.record(403, latency=0.1, retry_after=retry_after)
+
+    now[0] += 29
+    assert limiter.is_open
+    now[0] += 1
+    assert not limiter.is_open
+
+
+def test_open_breaker_fails_fast():
+    limiter = AdaptiveLimiter("test")
+    limiter.open_for(60)
+
+    async def main():
+        async with limiter.slot():
+            pass
+
+    with pytest.raises(CircuitOpen):
+        asyncio.run(main())
+
+
+def test_queued_callers_fail_fast_once_breaker_opens():
+    limiter = AdaptiveLimiter("test", initial=1, minimum=1)
+    sent = []
+
+    async def call(i):
+        async with limiter.slot():
+            sent.append(i)
+            if i == 0:
+                # First call gets rate limited while the rest are queued
+                await asyncio.sleep(0.01)
+                limiter.record(429, latency=0.01, retry_after="60")
+
+    async def main():
+        return await asyncio.gather(*(call(i) for i in range(5)), return_exceptions=True)
+
+    results = asyncio.run(main())
+
+    assert sent == [0]
+    assert results[0] is None
+    assert all(isinstance(result, CircuitOpen) for result in results[1:])
+    assert limiter._in_flight == 0